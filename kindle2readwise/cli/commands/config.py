@@ -4,23 +4,41 @@ import logging
 import sys
 
 from ...config import (
+    TOKEN_NOT_SET,
     get_config_dir,
     get_config_value,
     get_data_dir,
-    get_readwise_token,
-    is_configured,
     list_config,
     set_config_value,
     set_readwise_token,
 )
+from ...logging_config import LOG_LEVELS
 from ...utils.credentials import mask_token
 
 logger = logging.getLogger(__name__)
 
+# Human-readable name of the running platform; sys.platform is fixed for the process lifetime
+_PLATFORM_NAME = {"darwin": "macOS", "win32": "Windows", "linux": "Linux"}.get(sys.platform, sys.platform)
+
+# Keys that 'config set' may change, in the order they are listed in error messages
+_SETTABLE_KEYS = ("export_format", "auto_confirm", "log_level", "database_path")
+
+# Accepted spellings for boolean configuration values
+_BOOL_VALUES = {
+    "true": True,
+    "yes": True,
+    "1": True,
+    "on": True,
+    "false": False,
+    "no": False,
+    "0": False,
+    "off": False,
+}
+
 
 def handle_configure(args):
     """Handle the 'config' command and its subcommands."""
-    if not hasattr(args, "config_command") or not args.config_command:
+    if not getattr(args, "config_command", None):
         # Default to 'show' if no subcommand specified
         args.config_command = "show"
 
@@ -33,7 +51,7 @@ def handle_configure(args):
     elif args.config_command == "paths":
         handle_config_paths(args)
     else:
-        logger.error(f"Unknown config subcommand: {args.config_command}")
+        logger.error("Unknown config subcommand: %s", args.config_command)
         sys.exit(1)
 
 
@@ -49,12 +67,12 @@ def handle_config_show(_):
     print(f"\nConfiguration directory: {get_config_dir()}")
     print(f"Data directory: {get_data_dir()}")
 
-    if is_configured():
+    # list_config already looked up the token, which is all that is_configured() checks
+    if config["readwise_token"] != TOKEN_NOT_SET:
         print("\nApplication is properly configured.")
     else:
         print("\nWARNING: Application is not fully configured.")
-        if not get_readwise_token():
-            print("Missing Readwise API token. Set it with 'kindle2readwise config token'.")
+        print("Missing Readwise API token. Set it with 'kindle2readwise config token'.")
 
 
 def handle_config_token(args):
@@ -62,34 +80,41 @@ def handle_config_token(args):
     if args.token:
         # Set the token from the command line argument
         token = args.token
-        if set_readwise_token(token):
-            logger.info("Readwise API token successfully saved.")
-            print(f"Readwise API token {mask_token(token)} successfully saved.")
-        else:
-            logger.error("Failed to save Readwise API token.")
-            print("Failed to save Readwise API token.")
+    elif getattr(args, "stdin", False):
+        # Piped input is only read when asked for; an open pipe with no data would block forever
+        token = sys.stdin.readline().strip()
+        if not token:
+            logger.error("No token provided on stdin.")
+            print("Error: No token provided on stdin.")
             sys.exit(1)
+    elif not sys.stdin.isatty():
+        # Non-interactive use (CI, scripts) without a token: fail fast instead of prompting
+        logger.error("No token provided and stdin is not a TTY.")
+        print("Error: No token provided and stdin is not a TTY.")
+        print("Pass it as an argument (kindle2readwise config token TOKEN) or pipe it with --stdin.")
+        sys.exit(1)
     else:
         # Interactive mode - prompt for token
         try:
             import getpass
 
             token = getpass.getpass("Enter your Readwise API token: ")
-            if not token:
-                print("No token provided. Operation cancelled.")
-                return
-
-            if set_readwise_token(token):
-                logger.info("Readwise API token successfully saved.")
-                print(f"Readwise API token {mask_token(token)} successfully saved.")
-            else:
-                logger.error("Failed to save Readwise API token.")
-                print("Failed to save Readwise API token.")
-                sys.exit(1)
         except (KeyboardInterrupt, EOFError):
             print("\nOperation cancelled.")
             return
 
+        if not token:
+            print("No token provided. Operation cancelled.")
+            return
+
+    if set_readwise_token(token):
+        logger.info("Readwise API token successfully saved.")
+        print(f"Readwise API token {mask_token(token)} successfully saved.")
+    else:
+        logger.error("Failed to save Readwise API token.")
+        print("Failed to save Readwise API token.")
+        sys.exit(1)
+
 
 def handle_config_set(args):
     """Set a configuration value."""
@@ -100,39 +125,34 @@ def handle_config_set(args):
         sys.exit(1)
 
     # Validate key is a known configuration option
-    valid_keys = ["export_format", "auto_confirm", "log_level", "database_path"]
-    if args.key not in valid_keys:
-        logger.error(f"Unknown configuration key: {args.key}")
+    if args.key not in _SETTABLE_KEYS:
+        logger.error("Unknown configuration key: %s", args.key)
         print(f"Error: Unknown configuration key: {args.key}")
-        print(f"Valid keys are: {', '.join(valid_keys)}")
+        print(f"Valid keys are: {', '.join(_SETTABLE_KEYS)}")
         sys.exit(1)
 
     # Special handling for boolean values
     if args.key == "auto_confirm":
-        if args.value.lower() in ("true", "yes", "1", "on"):
-            value = True
-        elif args.value.lower() in ("false", "no", "0", "off"):
-            value = False
-        else:
-            logger.error(f"Invalid boolean value for {args.key}: {args.value}")
+        value = _BOOL_VALUES.get(args.value.lower())
+        if value is None:
+            logger.error("Invalid boolean value for %s: %s", args.key, args.value)
             print("Error: Invalid boolean value. Use 'true' or 'false'.")
             sys.exit(1)
     # Validate log_level values
     elif args.key == "log_level":
-        valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if args.value.upper() not in valid_log_levels:
-            logger.error(f"Invalid log level: {args.value}")
-            print(f"Error: Invalid log level. Valid values are: {', '.join(valid_log_levels)}")
-            sys.exit(1)
         value = args.value.upper()
+        if value not in LOG_LEVELS:
+            logger.error("Invalid log level: %s", args.value)
+            print(f"Error: Invalid log level. Valid values are: {', '.join(LOG_LEVELS)}")
+            sys.exit(1)
     else:
         value = args.value
 
     if set_config_value(args.key, value):
-        logger.info(f"Configuration value set: {args.key} = {value}")
+        logger.info("Configuration value set: %s = %s", args.key, value)
         print(f"Configuration updated: {args.key} = {value}")
     else:
-        logger.error(f"Failed to set configuration value: {args.key}")
+        logger.error("Failed to set configuration value: %s", args.key)
         print("Error: Failed to update configuration.")
         sys.exit(1)
 
@@ -144,17 +164,4 @@ def handle_config_paths(_):
     print(f"Data directory: {get_data_dir()}")
     print(f"Database path: {get_config_value('database_path')}")
 
-    # Detect platform
-    import sys
-
-    system = sys.platform
-    if system.startswith("darwin"):
-        platform_name = "macOS"
-    elif system.startswith("win"):
-        platform_name = "Windows"
-    elif system.startswith("linux"):
-        platform_name = "Linux"
-    else:
-        platform_name = system
-
-    print(f"Detected platform: {platform_name}")
+    print(f"Detected platform: {_PLATFORM_NAME}")
@@ -1,6 +1,8 @@
 """Export command handler for the kindle2readwise CLI."""
 
 import logging
+import os
+import re
 import sys
 from pathlib import Path
 
@@ -9,11 +11,14 @@ from ...core import Kindle2Readwise
 from ...database import DEFAULT_DB_PATH
 from ...exceptions import ProcessingError, ValidationError
 from ..utils.common import get_default_clippings_path, get_readwise_token_cli
-from ..utils.formatters import format_export_summary
+from ..utils.formatters import format_export_summary, format_pending_highlights
 from .devices import handle_devices
 
 logger = logging.getLogger(__name__)
 
+# One entry of an interactive selection; entries are separated by commas and/or whitespace
+_SELECTION_ENTRY_RE = re.compile(r"[^,\s]+")
+
 
 def should_detect_devices(args):
     """Check if automatic device detection should be performed.
@@ -25,7 +30,7 @@ def should_detect_devices(args):
         bool: Whether to perform device detection
     """
     # If devices flag is explicitly set, do device detection
-    if hasattr(args, "devices") and args.devices:
+    if getattr(args, "devices", False):
         return True
 
     # If a specific file is provided, skip device detection
@@ -51,16 +56,17 @@ def handle_export(args):
 
     # Setup part
     readwise_token = _get_export_token(args)
-    clippings_file = _get_export_clippings_file(args)
+    clippings_file, clippings_file_exists = _get_export_clippings_file(args)
     db_path = _get_export_db_path(args)
     _check_export_options(args)
 
     # Check if file exists
-    if not clippings_file.exists():
-        logger.critical(f"Clippings file not found: {clippings_file}")
+    if not clippings_file_exists:
+        logger.critical("Clippings file not found: %s", clippings_file)
         sys.exit(1)
 
     # Execute export
+    app = None
     try:
         app = Kindle2Readwise(
             clippings_file=str(clippings_file),
@@ -103,7 +109,7 @@ def handle_export(args):
         sys.exit(1)
     finally:
         # Ensure DB connection is closed if app object was created
-        if "app" in locals() and app:
+        if app is not None:
             app.close_db()
 
 
@@ -120,15 +126,18 @@ def _get_export_token(args):
     return readwise_token
 
 
-def _get_export_clippings_file(args):
-    """Get clippings file path for export command."""
+def _get_export_clippings_file(args) -> tuple[Path, bool]:
+    """Get clippings file path for export command.
+
+    Returns:
+        The absolute clippings file path and whether it exists, so callers needn't probe it again
+    """
     # If an explicit file was provided and it exists, use it directly
     if args.file != "My Clippings.txt" and Path(args.file).exists():
-        clippings_file_path = Path(args.file)
-        if not clippings_file_path.is_absolute():
-            clippings_file_path = Path.cwd() / clippings_file_path
+        # _absolute_path anchors a relative path to the working directory itself
+        clippings_file_path = _absolute_path(args.file)
         logger.debug("Using explicitly provided clippings file: %s", clippings_file_path)
-        return clippings_file_path.resolve()
+        return clippings_file_path, True
 
     # If no explicit file was provided or the default doesn't exist in current dir,
     # try to automatically detect Kindle device
@@ -136,7 +145,7 @@ def _get_export_clippings_file(args):
         default_path = get_default_clippings_path()
         if default_path:
             logger.info("Using automatically detected Kindle clippings file: %s", default_path)
-            return Path(default_path).resolve()
+            return _absolute_path(default_path), True
 
     # If we get here, we'll use the provided file path even if it doesn't exist
     # (the validation will later catch the issue)
@@ -144,13 +153,14 @@ def _get_export_clippings_file(args):
     if not clippings_file_path.is_absolute():
         clippings_file_path = Path.cwd() / clippings_file_path
 
-    if not clippings_file_path.exists():
+    exists = clippings_file_path.exists()
+    if not exists:
         logger.warning(
             "Clippings file not found: %s. Make sure your Kindle is connected or provide the correct path.",
             clippings_file_path,
         )
 
-    return clippings_file_path.resolve()
+    return _absolute_path(clippings_file_path), exists
 
 
 def _get_export_db_path(args):
@@ -158,7 +168,16 @@ def _get_export_db_path(args):
     db_path = args.db_path
     if not db_path:
         db_path = get_config_value("database_path", DEFAULT_DB_PATH)
-    return Path(db_path).resolve()
+    return _absolute_path(db_path)
+
+
+def _absolute_path(path: str | Path) -> Path:
+    """Make a path absolute and normalized without touching the filesystem.
+
+    Unlike ``Path.resolve()`` this does not stat each component or follow symlinks, which is
+    all the export command needs to report and open its files.
+    """
+    return Path(os.path.abspath(path))
 
 
 def _check_export_options(args):
@@ -188,33 +207,8 @@ def handle_interactive_mode(app, clippings_file):
         print("\nNo new highlights found to export.")
         return None
 
-    # Display highlights for review
-    print("\n=== Interactive Export Mode ===")
-    print(f"Found {len(pending_highlights)} new highlights to export.\n")
-
-    # Group highlights by book
-    books = {}
-    for highlight in pending_highlights:
-        book_key = f"{highlight['title']} - {highlight['author']}"
-        if book_key not in books:
-            books[book_key] = []
-        books[book_key].append(highlight)
-
-    # Display highlights grouped by book
-    for book_key, highlights in books.items():
-        print(f"\n📚 {book_key}")
-        print("-" * 80)
-
-        for highlight in highlights:
-            print(f"  [{highlight['id']}] {highlight['highlight'][:100]}...")
-            print(f"      Location: {highlight['location']}, Date: {highlight['date']}")
-            print()
-
-    # Instructions for selection
-    print("\nSelect highlights to export:")
-    print("  - Enter highlight IDs separated by commas (e.g., '1,3,5')")
-    print("  - Enter 'a' to select all highlights")
-    print("  - Enter 'q' to quit without exporting")
+    # Display highlights for review, along with the selection instructions
+    print(format_pending_highlights(pending_highlights))
 
     # Get user selection
     selection = input("\nYour selection: ").strip().lower()
@@ -229,20 +223,22 @@ def handle_interactive_mode(app, clippings_file):
         selected_ids = [h["id"] for h in pending_highlights]
         print(f"Selected all {len(selected_ids)} highlights.")
     else:
-        # Parse the selection
-        try:
-            selected_ids = [int(id_str.strip()) for id_str in selection.split(",") if id_str.strip()]
-            valid_ids = [id for id in selected_ids if any(h["id"] == id for h in pending_highlights)]
-
-            if len(valid_ids) != len(selected_ids):
-                invalid_ids = set(selected_ids) - set(valid_ids)
-                print(f"Warning: Invalid IDs ignored: {', '.join(map(str, invalid_ids))}")
-
-            selected_ids = valid_ids
-            print(f"Selected {len(selected_ids)} highlights.")
-        except ValueError:
-            print("Invalid selection format. Export cancelled.")
-            return None
+        # Parse the selection, reporting entries that aren't IDs instead of rejecting the whole input
+        entries = _SELECTION_ENTRY_RE.findall(selection)
+        unrecognized = [entry for entry in entries if not entry.isdecimal()]
+        if unrecognized:
+            print(f"Warning: Unrecognized entries ignored: {', '.join(unrecognized)}")
+
+        selected_ids = [int(entry) for entry in entries if entry.isdecimal()]
+        pending_ids = {h["id"] for h in pending_highlights}
+        valid_ids = [id for id in selected_ids if id in pending_ids]
+
+        if len(valid_ids) != len(selected_ids):
+            invalid_ids = set(selected_ids) - pending_ids
+            print(f"Warning: Invalid IDs ignored: {', '.join(map(str, invalid_ids))}")
+
+        selected_ids = valid_ids
+        print(f"Selected {len(selected_ids)} highlights.")
 
     # Confirm export
     if selected_ids:
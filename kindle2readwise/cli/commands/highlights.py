@@ -1,16 +1,18 @@
 """Highlights command handler for the kindle2readwise CLI."""
 
-import json
 import logging
 import sys
+from itertools import chain
 
 from ...config import get_config_value
-from ...database import DEFAULT_DB_PATH, HighlightsDAO
+from ...database import DEFAULT_DB_PATH, HighlightsDAO, decode_highlight_cursor, encode_highlight_cursor
 from ..utils.formatters import (
+    dumps_json,
     format_books_text,
-    format_highlights_csv,
-    format_highlights_json,
     format_highlights_text,
+    write_highlights_csv,
+    write_highlights_json,
+    write_highlights_ndjson,
 )
 
 logger = logging.getLogger(__name__)
@@ -20,6 +22,11 @@ def handle_highlights(args):
     """Handle the 'highlights' command to list and search highlights."""
     logger.info("Starting 'highlights' command.")
 
+    if getattr(args, "highlights_command", None) == "delete" and (args.id is None) == (args.book is None):
+        logger.error("Exactly one of --id or --book must be given.")
+        print("Error: Specify exactly one of --id or --book.")
+        sys.exit(1)
+
     # Get database path from config if not provided
     db_path = get_config_value("database_path", DEFAULT_DB_PATH)
 
@@ -27,19 +34,16 @@ def handle_highlights(args):
         # Initialize the DAO
         dao = HighlightsDAO(db_path)
 
-        # Process different sub-commands
-        if hasattr(args, "highlights_command"):
-            if args.highlights_command == "list":
-                _handle_highlights_list(dao, args)
-            elif args.highlights_command == "books":
-                _handle_highlights_books(dao, args)
-            elif args.highlights_command == "delete":
-                _handle_highlights_delete(dao, args)
-            else:
-                print("Unknown subcommand. Use 'kindle2readwise highlights --help' for usage information.")
-        else:
-            # Default: list highlights with no filters
+        # Process different sub-commands; without one, list highlights with no filters
+        highlights_command = getattr(args, "highlights_command", None) or "list"
+        if highlights_command == "list":
             _handle_highlights_list(dao, args)
+        elif highlights_command == "books":
+            _handle_highlights_books(dao, args)
+        elif highlights_command == "delete":
+            _handle_highlights_delete(dao, args)
+        else:
+            print("Unknown subcommand. Use 'kindle2readwise highlights --help' for usage information.")
 
     except Exception as e:
         logger.error("Error processing highlights command: %s", e, exc_info=True)
@@ -53,31 +57,100 @@ def _handle_highlights_list(dao: HighlightsDAO, args):
     title = getattr(args, "title", None)
     author = getattr(args, "author", None)
     text = getattr(args, "text", None)
+    title_prefix = getattr(args, "title_prefix", None)
+    author_prefix = getattr(args, "author_prefix", None)
     limit = getattr(args, "limit", 20)
-    offset = getattr(args, "offset", 0)
+    offset = getattr(args, "offset", None)
+    after = getattr(args, "after", None)
     sort_by = getattr(args, "sort", "date_exported")
     sort_dir = getattr(args, "order", "desc")
     output_format = getattr(args, "format", None)
+    # NDJSON has no header, so there is no total to count
+    ndjson = output_format == "json" and getattr(args, "stream", False)
+    with_total = not (getattr(args, "no_total", False) or ndjson)
+
+    # Decode the cursor up front so a bad one is reported as a usage error, not a query failure
+    if after:
+        try:
+            after = decode_highlight_cursor(after, sort_by, sort_dir)
+        except ValueError as e:
+            logger.error("Invalid --after cursor: %s", e)
+            print(f"Error: invalid --after cursor ({e})")
+            sys.exit(1)
+
+    if offset is None:
+        offset = 0
+    else:
+        logger.warning("--offset is deprecated; use --after with the cursor printed after the previous page.")
+
+    query = {
+        "title": title,
+        "author": author,
+        "text_search": text,
+        "title_prefix": title_prefix,
+        "author_prefix": author_prefix,
+        # One row past the page tells whether another page follows it
+        "limit": limit + 1 if limit > 0 else limit,
+        "offset": offset,
+        "sort_by": sort_by,
+        "sort_dir": sort_dir,
+        "after": after,
+        "with_total": with_total,
+    }
+
+    # JSON and CSV are streamed from the cursor; the text view needs the whole page for its summary
+    if output_format in ("json", "csv"):
+        highlights, count = dao.iter_highlights_with_total(**query)
+        first = next(highlights, None)
+        if first is None:
+            print("No highlights found with the specified filters.")
+            return
 
-    # Get the count first for the summary info
-    count = dao.get_highlight_count_with_filters(title=title, author=author, text_search=text)
+        page = {"rows": 0, "last": None, "more": False}
+        highlights = _track_page(chain((first,), highlights), limit, page)
+        if ndjson:
+            write_highlights_ndjson(highlights, sys.stdout)
+        elif output_format == "json":
+            write_highlights_json(highlights, count, limit, offset, sys.stdout)
+        else:
+            write_highlights_csv(highlights, sys.stdout)
+
+        # Keep stdout machine-readable; the cursor goes to stderr for structured formats
+        next_cursor = _next_page_cursor(page["last"], page["more"], sort_by, sort_dir)
+        if next_cursor:
+            print(f"Next page: --after {next_cursor}", file=sys.stderr)
+        return
 
-    # Get filtered highlights
-    highlights = dao.get_highlights(
-        title=title, author=author, text_search=text, limit=limit, offset=offset, sort_by=sort_by, sort_dir=sort_dir
-    )
+    # Get filtered highlights along with the total match count for the summary info
+    highlights, count = dao.get_highlights_with_total(**query)
 
     if not highlights:
         print("No highlights found with the specified filters.")
         return
 
-    # Handle different output formats
-    if output_format == "json":
-        print(format_highlights_json(highlights, count, limit, offset))
-    elif output_format == "csv":
-        print(format_highlights_csv(highlights))
-    else:
-        print(format_highlights_text(highlights, count, limit, offset))
+    more = 0 < limit < len(highlights)
+    if more:
+        highlights = highlights[:limit]
+    next_cursor = _next_page_cursor(highlights[-1], more, sort_by, sort_dir)
+    print(format_highlights_text(highlights, count, limit, offset, next_cursor))
+
+
+def _track_page(highlights, limit: int, page: dict):
+    """Pass up to ``limit`` highlights through, recording the last one and whether more followed in ``page``."""
+    for highlight in highlights:
+        if 0 < limit <= page["rows"]:
+            page["more"] = True
+            return
+        page["rows"] += 1
+        page["last"] = highlight
+        yield highlight
+
+
+def _next_page_cursor(last: dict | None, more: bool, sort_by: str, sort_dir: str) -> str | None:
+    """Return the cursor for the page after this one, or None if no highlight follows it."""
+    if last is None or not more:
+        return None
+    return encode_highlight_cursor(last, sort_by, sort_dir)
 
 
 def _handle_highlights_books(dao: HighlightsDAO, args):
@@ -87,11 +160,10 @@ def _handle_highlights_books(dao: HighlightsDAO, args):
     # Format output based on requested format
     format_type = getattr(args, "format", "text")
     if format_type == "json":
-        print(json.dumps(books, indent=2))
+        print(dumps_json(books))
         return
     if format_type == "csv":
         import csv
-        import sys
 
         writer = csv.DictWriter(sys.stdout, fieldnames=["title", "author", "highlight_count"])
         writer.writeheader()
@@ -104,8 +176,8 @@ def _handle_highlights_books(dao: HighlightsDAO, args):
 
 def _handle_highlights_delete(dao: HighlightsDAO, args):
     """Handle deleting highlights."""
-    # Check which delete option was specified
-    if hasattr(args, "id") and args.id:
+    # Exactly one delete option is set; handle_highlights has already checked
+    if args.id is not None:
         # Delete a single highlight by ID
         highlight_id = args.id
         if not args.force:
@@ -120,32 +192,31 @@ def _handle_highlights_delete(dao: HighlightsDAO, args):
         else:
             print(f"Failed to delete highlight with ID {highlight_id}.")
 
-    elif hasattr(args, "book") and args.book:
+    else:
         # Delete highlights for a specific book
         title = args.book
-        author = args.author if hasattr(args, "author") else None
+        author = getattr(args, "author", None)
 
-        # Get count of highlights to be deleted
-        count = dao.get_highlight_count_with_filters(title=title, author=author)
-
-        if count == 0:
-            print(f"No highlights found for book '{title}'{f' by {author}' if author else ''}.")
-            return
+        book_label = f"'{title}'{f' by {author}' if author else ''}"
 
         if not args.force:
-            confirm = input(
-                f"Are you sure you want to delete {count} highlights for '{title}'"
-                f"{f' by {author}' if author else ''}? (y/N): "
-            )
+            # Count the highlights to be deleted so the prompt can show it
+            count = dao.get_highlight_count_with_filters(title=title, author=author)
+            if count == 0:
+                print(f"No highlights found for book {book_label}.")
+                return
+
+            confirm = input(f"Are you sure you want to delete {count} highlights for {book_label}? (y/N): ")
             if confirm.lower() != "y":
                 print("Deletion cancelled.")
                 return
 
+        # With --force there is no prompt, so the DELETE's own row count is all we need
         deleted = dao.delete_highlights_by_book(title, author)
         if deleted > 0:
             print(f"Successfully deleted {deleted} highlights.")
+        elif args.force:
+            print(f"No highlights found for book {book_label}.")
         else:
             print("No highlights were deleted.")
 
-    else:
-        print("No delete options specified. Use --id or --book to specify what to delete.")
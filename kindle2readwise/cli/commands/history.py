@@ -1,25 +1,26 @@
 """History command handler for the kindle2readwise CLI."""
 
 import csv
-import json
 import logging
 import sys
 
 from ...config import get_config_value
 from ...database import DEFAULT_DB_PATH, HighlightsDAO
 from ..utils.formatters import (
+    MAX_AUTHOR_LENGTH,
     MAX_HIGHLIGHTS_PREVIEW,
+    MAX_TITLE_LENGTH,
+    SESSION_HIGHLIGHT_HEADER,
+    SESSION_HIGHLIGHT_ROW_FORMAT,
+    SESSION_HIGHLIGHT_SEPARATOR,
+    dumps_json,
     format_history_table,
     format_session_details,
+    truncate_text,
 )
 
 logger = logging.getLogger(__name__)
 
-# Constants for string truncation
-MAX_TITLE_LENGTH = 30
-MAX_AUTHOR_LENGTH = 20
-TRUNCATION_SUFFIX = "..."
-
 
 def handle_history(args):
     """Handle the 'history' command to display export history."""
@@ -28,17 +29,26 @@ def handle_history(args):
     # Get database path from args if provided, else from config
     db_path = getattr(args, "db_path", None) or get_config_value("database_path", DEFAULT_DB_PATH)
 
+    session_id = getattr(args, "session", None)
+    output_format = getattr(args, "format", None)
+    limit = getattr(args, "limit", 10)
+
+    # Nothing can be listed with a zero limit, so don't open the database at all
+    if not session_id and limit == 0:
+        print("No export history found.")
+        return
+
+    dao = None
     try:
         # Initialize the DAO
         dao = HighlightsDAO(db_path)
 
         # Handle specific session details if requested
-        if hasattr(args, "session") and args.session:
-            _show_session_details(dao, args.session, args.format if hasattr(args, "format") else "text")
+        if session_id:
+            _show_session_details(dao, session_id, output_format or "text")
             return
 
         # Get export history with specified limit
-        limit = args.limit if hasattr(args, "limit") else 10
         history = dao.get_export_history(limit=limit)
 
         if not history:
@@ -46,22 +56,26 @@ def handle_history(args):
             return
 
         # Display based on format
-        if hasattr(args, "format") and args.format in ["json", "csv"]:
-            _export_history_formatted(history, args.format)
+        if output_format in ("json", "csv"):
+            _export_history_formatted(history, output_format)
         else:
             # Display the history table
             print(format_history_table(history))
 
             # Show details if requested
-            if hasattr(args, "details") and args.details:
-                print("\n--- Detailed Information ---")
-                for session in history:
-                    print(format_session_details(session))
+            if getattr(args, "details", False):
+                details = ["\n--- Detailed Information ---"]
+                details.extend(format_session_details(session) for session in history)
+                print("\n".join(details))
 
     except Exception as e:
         logger.error("Error retrieving export history: %s", e, exc_info=True)
         print(f"Error retrieving export history: {e}")
         sys.exit(1)
+    finally:
+        # Ensure DB connection is closed if the DAO was created
+        if dao is not None:
+            dao.close()
 
 
 def _show_session_details(dao: HighlightsDAO, session_id: int, format_type: str = "text"):
@@ -78,7 +92,7 @@ def _show_session_details(dao: HighlightsDAO, session_id: int, format_type: str
     # Format and display based on format type
     if format_type == "json":
         session_data = {"session": session, "highlights": highlights}
-        print(json.dumps(session_data, indent=2, default=str))
+        print(dumps_json(session_data))
     elif format_type == "csv":
         _output_session_csv(session, highlights)
     else:
@@ -87,29 +101,26 @@ def _show_session_details(dao: HighlightsDAO, session_id: int, format_type: str
 
         # Show highlight summary if available
         if highlights:
-            print(f"\nHighlights in this session: {len(highlights)}")
-            print(f"{'Title':<30} {'Author':<20} {'Status':<10}")
-            print("-" * 70)
+            output = [
+                f"\nHighlights in this session: {len(highlights)}",
+                SESSION_HIGHLIGHT_HEADER,
+                SESSION_HIGHLIGHT_SEPARATOR,
+            ]
 
             for h in highlights[:MAX_HIGHLIGHTS_PREVIEW]:  # Show only first few for brevity
-                title = h.get("title", "")
-                if len(title) > MAX_TITLE_LENGTH:
-                    title = title[:27] + TRUNCATION_SUFFIX
-
-                author = h.get("author", "")
-                if len(author) > MAX_AUTHOR_LENGTH:
-                    author = author[:17] + TRUNCATION_SUFFIX
-
-                print(f"{title:<30} {author:<20} {h.get('status', ''):<10}")
+                title = truncate_text(h.get("title", ""), MAX_TITLE_LENGTH)
+                author = truncate_text(h.get("author", ""), MAX_AUTHOR_LENGTH)
+                output.append(SESSION_HIGHLIGHT_ROW_FORMAT.format(title, author, h.get("status", "")))
 
             if len(highlights) > MAX_HIGHLIGHTS_PREVIEW:
-                print(f"... and {len(highlights) - MAX_HIGHLIGHTS_PREVIEW} more highlights")
+                output.append(f"... and {len(highlights) - MAX_HIGHLIGHTS_PREVIEW} more highlights")
+
+            print("\n".join(output))
 
 
 def _output_session_csv(session, highlights):
     """Output session details as CSV."""
-    output = _create_csv_writer()
-    writer = output["writer"]
+    writer = csv.writer(sys.stdout)
 
     # Write session info
     writer.writerow(["Session Information"])
@@ -131,28 +142,25 @@ def _output_session_csv(session, highlights):
         writer.writerow([])
         writer.writerow(["Highlights"])
         writer.writerow(["Title", "Author", "Text", "Location", "Date Highlighted", "Status"])
-        for h in highlights:
-            writer.writerow(
-                [
-                    h.get("title"),
-                    h.get("author"),
-                    h.get("text"),
-                    h.get("location"),
-                    h.get("date_highlighted"),
-                    h.get("status"),
-                ]
+        writer.writerows(
+            (
+                h.get("title"),
+                h.get("author"),
+                h.get("text"),
+                h.get("location"),
+                h.get("date_highlighted"),
+                h.get("status"),
             )
-
-    print(output["stream"].getvalue())
+            for h in highlights
+        )
 
 
 def _export_history_formatted(history: list[dict], format_type: str):
     """Export history in the specified format (JSON or CSV)."""
     if format_type == "json":
-        print(json.dumps(history, indent=2, default=str))
+        print(dumps_json(history))
     elif format_type == "csv":
-        output = _create_csv_writer()
-        writer = output["writer"]
+        writer = csv.writer(sys.stdout)
 
         # Write header
         writer.writerow(
@@ -169,27 +177,16 @@ def _export_history_formatted(history: list[dict], format_type: str):
         )
 
         # Write rows
-        for session in history:
-            writer.writerow(
-                [
-                    session.get("id"),
-                    session.get("start_time"),
-                    session.get("end_time"),
-                    session.get("status"),
-                    session.get("highlights_total"),
-                    session.get("highlights_new"),
-                    session.get("highlights_dupe"),
-                    session.get("source_file"),
-                ]
+        writer.writerows(
+            (
+                session.get("id"),
+                session.get("start_time"),
+                session.get("end_time"),
+                session.get("status"),
+                session.get("highlights_total"),
+                session.get("highlights_new"),
+                session.get("highlights_dupe"),
+                session.get("source_file"),
             )
-
-        print(output["stream"].getvalue())
-
-
-def _create_csv_writer():
-    """Create a CSV writer with a StringIO stream."""
-    import io
-
-    stream = io.StringIO()
-    writer = csv.writer(stream)
-    return {"stream": stream, "writer": writer}
+            for session in history
+        )
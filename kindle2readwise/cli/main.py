@@ -3,28 +3,38 @@
 import logging
 import sys
 
+from ..exceptions import Kindle2ReadwiseError
 from ..logging_config import setup_logging
-from .parsers import create_parser
+from .parsers import COMMAND_HANDLERS, parse_args
 
 logger = logging.getLogger(__name__)
 
+# Commands that only print and never log; they need no logging setup unless a log file was requested
+_SILENT_COMMANDS = frozenset({"version"})
+
+# Failures with a self-explanatory message; a traceback adds nothing for the user
+_EXPECTED_ERRORS = (Kindle2ReadwiseError, OSError)
+
 
 def main() -> None:
     """Main entry point for the CLI application."""
-    parser = create_parser()
-
     # Parse arguments and set up logging
-    args = parser.parse_args()
+    args = parse_args()
 
     # Configure logging based on arguments
-    level_name = args.log_level  # This already has the name as a string
-    setup_logging(level=level_name, log_file=args.log_file)
+    if args.command not in _SILENT_COMMANDS or args.log_file:
+        level_name = args.log_level  # This already has the name as a string
+        setup_logging(level=level_name, log_file=args.log_file)
 
     # Call the appropriate function
     try:
-        args.func(args)
+        COMMAND_HANDLERS[args.command](args)
+    except _EXPECTED_ERRORS as e:
+        logger.error("%s", e)
+        sys.exit(1)
     except Exception as e:
-        logger.error("Unhandled exception: %s", e, exc_info=True)
+        # Only render the traceback when the user asked for debug output
+        logger.error("Unhandled exception: %s", e, exc_info=args.log_level == "DEBUG")
         sys.exit(1)
 
 
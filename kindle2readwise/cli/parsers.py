@@ -1,71 +1,206 @@
 """Command-line argument parsers for kindle2readwise."""
 
 import argparse
+import importlib
+import sys
+from collections.abc import Callable
+from functools import lru_cache
 
 from .. import __version__
+from ..logging_config import LOG_LEVELS
 
+PROG = "kindle2readwise"
 DEFAULT_CLIPPINGS_PATH = "My Clippings.txt"
+DEFAULT_LOG_LEVEL = "WARNING"
+VERSION_TEXT = f"{PROG} {__version__}"
+
+# Choices shared by several subcommands
+SORT_FIELDS = ("date_exported", "date_highlighted", "title", "author")
+SORT_DIRECTIONS = ("asc", "desc")
+OUTPUT_FORMATS = ("text", "json", "csv")
+HISTORY_FORMATS = ("json", "csv")
+DB_PATH_HELP = "Path to the SQLite database (default: from config or database directory)."
+LOG_LEVEL_HELP = f"Set the logging level (default: {DEFAULT_LOG_LEVEL})."
+CLIPPINGS_FILE_HELP = f"Path to the 'My Clippings.txt' file (default: {DEFAULT_CLIPPINGS_PATH})"
+
+# Global options that consume the following argv token as their value
+GLOBAL_OPTIONS_WITH_VALUE = ("--log-level", "--log-file")
+
+# One-line help for each subcommand, shared by the full and the stub subparsers
+COMMAND_HELP = {
+    "export": "Export Kindle highlights to Readwise",
+    "config": "Configure the application",
+    "history": "View export history",
+    "highlights": "Manage stored highlights",
+    "version": "Show version information",
+    "reset-db": "Reset the database",
+}
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    A bare ``--version``/``-V`` is answered immediately and invocations without any options
+    (e.g. ``kindle2readwise config show``) are resolved from a lookup table; everything else
+    goes through the full argparse grammar.
+
+    Args:
+        argv: Command-line arguments without the program name (default: ``sys.argv[1:]``)
+
+    Returns:
+        The parsed arguments; ``COMMAND_HANDLERS[args.command]`` is the command handler
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if argv in (["--version"], ["-V"]):
+        # Same output and exit status as the argparse version action, without building the parser
+        print(VERSION_TEXT)
+        sys.exit(0)
+    return _fast_parse(argv) or create_parser(argv).parse_args(argv)
+
+
+def create_parser(argv: list[str] | None = None) -> argparse.ArgumentParser:
+    """Create the main argument parser.
+
+    Only the subcommand named in ``argv`` is fully built.
+    All other subcommands are registered as bare stubs, so ``--help`` and usage
+    errors still list every command.
+
+    Args:
+        argv: Command-line arguments without the program name (default: ``sys.argv[1:]``)
+
+    Returns:
+        The configured argument parser
+    """
+    command = _sniff_command(sys.argv[1:] if argv is None else argv)
 
-
-def create_parser() -> argparse.ArgumentParser:
-    """Create the main argument parser with all subcommands."""
     parser = argparse.ArgumentParser(
-        description="Export Kindle clippings ('My Clippings.txt') to Readwise.", prog="kindle2readwise"
+        description="Export Kindle clippings ('My Clippings.txt') to Readwise.", prog=PROG
     )
 
     # Global options
     _setup_global_options(parser)
 
-    subparsers = parser.add_subparsers(dest="command", required=True, help="Available commands")
+    subparsers = parser.add_subparsers(dest="command", required=True, metavar="COMMAND", help="Available commands")
 
-    # Add all command subparsers
-    _setup_export_command(subparsers)
-    _setup_config_command(subparsers)
-    _setup_history_command(subparsers)
-    _setup_highlights_command(subparsers)
-    _setup_version_command(subparsers)
-    _setup_reset_db_command(subparsers)
+    # Build the requested command, register the rest as stubs
+    for name, setup_command in _COMMAND_SETUP.items():
+        if name == command:
+            setup_command(subparsers)
+        else:
+            subparsers.add_parser(name, help=COMMAND_HELP[name])
 
     return parser
 
 
+def _fast_parse(argv: list[str]) -> argparse.Namespace | None:
+    """Resolve option-free invocations without building the argparse grammar.
+
+    The resulting namespace is identical to what the full parser produces for the same argv.
+
+    Args:
+        argv: Command-line arguments without the program name
+
+    Returns:
+        The parsed arguments, or None if argv needs the full parser
+    """
+    fast_path = _FAST_PATHS.get(tuple(argv))
+    if fast_path is None:
+        return None
+    return argparse.Namespace(log_level=DEFAULT_LOG_LEVEL, log_file=None, **fast_path)
+
+
+def _sniff_command(argv: list[str]) -> str | None:
+    """Find the subcommand name in argv without running the full parser.
+
+    Args:
+        argv: Command-line arguments without the program name
+
+    Returns:
+        The subcommand name, or None if argv does not name a known command
+    """
+    skip_value = False
+    for token in argv:
+        if skip_value:
+            skip_value = False
+        elif token.startswith("--") and "=" not in token:
+            # argparse also accepts unambiguous prefixes of long options (e.g. --log-l)
+            skip_value = token != "--" and any(opt.startswith(token) for opt in GLOBAL_OPTIONS_WITH_VALUE)
+        elif not token.startswith("-"):
+            return token if token in COMMAND_HELP else None
+    return None
+
+
+def _lazy_handler(module: str, name: str) -> Callable[[argparse.Namespace], None]:
+    """Return a command handler that imports its module only when it is called.
+
+    Building a subparser (e.g. for ``kindle2readwise export --help``) then never pulls in the
+    database, parser or Readwise client modules behind the handler.
+
+    Args:
+        module: Module name inside ``kindle2readwise.cli.commands``
+        name: Name of the handler function in that module
+
+    Returns:
+        A function that forwards the parsed arguments to the real handler
+    """
+
+    def handler(args: argparse.Namespace) -> None:
+        command_module = importlib.import_module(f".commands.{module}", __package__)
+        return getattr(command_module, name)(args)
+
+    handler.__name__ = handler.__qualname__ = name
+    return handler
+
+
 def _setup_global_options(parser):
     """Set up global options for the CLI."""
     parser.add_argument(
-        "--version", action="version", version=f"%(prog)s {__version__}", help="Show program's version number and exit."
+        "--version",
+        "-V",
+        action="version",
+        version=VERSION_TEXT,
+        help="Show program's version number and exit.",
     )
     parser.add_argument(
         "--log-level",
         type=str.upper,
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
-        default="WARNING",
-        help="Set the logging level (default: WARNING).",
+        choices=LOG_LEVELS,
+        default=DEFAULT_LOG_LEVEL,
+        help=LOG_LEVEL_HELP,
     )
     parser.add_argument(
         "--log-file", type=str, default=None, help="Log output to a specified file in addition to the console."
     )
 
 
+@lru_cache(maxsize=1)
+def _db_path_parent() -> argparse.ArgumentParser:
+    """Return the parent parser holding the ``--db-path`` option shared by subcommands.
+
+    Subparsers created with ``parents=[_db_path_parent()]`` reuse its action instead of each
+    defining their own copy.
+
+    Returns:
+        A help-less parser with only the ``--db-path`` option
+    """
+    parent = argparse.ArgumentParser(add_help=False)
+    parent.add_argument("--db-path", type=str, help=DB_PATH_HELP)
+    return parent
+
+
 def _setup_export_command(subparsers):
     """Set up the export command and its options."""
-    from .commands.export import handle_export
-
-    parser_export = subparsers.add_parser("export", help="Export Kindle highlights to Readwise")
+    parser_export = subparsers.add_parser("export", parents=[_db_path_parent()], help=COMMAND_HELP["export"])
     parser_export.add_argument(
         "file",
         type=str,
         nargs="?",
         default=DEFAULT_CLIPPINGS_PATH,
-        help=f"Path to the 'My Clippings.txt' file (default: {DEFAULT_CLIPPINGS_PATH})",
+        help=CLIPPINGS_FILE_HELP,
     )
     parser_export.add_argument(
         "--api-token", "-t", type=str, help="Readwise API token (or use the READWISE_API_TOKEN environment variable)."
     )
-    parser_export.add_argument(
-        "--db-path",
-        type=str,
-        help="Path to the SQLite database (default: from config or database directory).",
-    )
     parser_export.add_argument("--force", "-f", action="store_true", help="Force export of all highlights.")
     parser_export.add_argument(
         "--dry-run", "-d", action="store_true", help="Simulate export without sending to Readwise."
@@ -78,119 +213,139 @@ def _setup_export_command(subparsers):
         action="store_true",
         help="Review and select highlights interactively before export",
     )
-    parser_export.set_defaults(func=handle_export)
 
 
 def _setup_config_command(subparsers):
     """Set up the config command and its subcommands."""
-    from .commands.config import handle_configure
-
-    parser_config = subparsers.add_parser("config", help="Configure the application")
-    config_subparsers = parser_config.add_subparsers(dest="config_command", help="Configuration commands")
+    parser_config = subparsers.add_parser("config", help=COMMAND_HELP["config"])
+    config_subparsers = parser_config.add_subparsers(
+        dest="config_command", metavar="SUBCOMMAND", help="Configuration commands"
+    )
 
     # Config show subcommand
-    parser_config_show = config_subparsers.add_parser("show", help="Show current configuration")
-    parser_config_show.set_defaults(func=handle_configure)
+    config_subparsers.add_parser("show", help="Show current configuration")
 
     # Config token subcommand
     parser_config_token = config_subparsers.add_parser("token", help="Set the Readwise API token")
     parser_config_token.add_argument(
-        "token", nargs="?", type=str, help="The Readwise API token (omit for interactive prompt)"
+        "token", nargs="?", type=str, help="The Readwise API token (omit to be prompted for it)"
+    )
+    parser_config_token.add_argument(
+        "--stdin", action="store_true", help="Read the token from the first line of standard input (for scripts)"
     )
-    parser_config_token.set_defaults(func=handle_configure)
 
     # Config set subcommand
     parser_config_set = config_subparsers.add_parser("set", help="Set a configuration value")
     parser_config_set.add_argument("key", type=str, help="Configuration key to set")
     parser_config_set.add_argument("value", type=str, help="Value to set")
-    parser_config_set.set_defaults(func=handle_configure)
 
     # Config paths subcommand
-    parser_config_paths = config_subparsers.add_parser("paths", help="Show configuration and data paths")
-    parser_config_paths.set_defaults(func=handle_configure)
-
-    parser_config.set_defaults(func=handle_configure)
+    config_subparsers.add_parser("paths", help="Show configuration and data paths")
 
 
 def _setup_history_command(subparsers):
     """Set up the history command and its options."""
-    from .commands.history import handle_history
-
-    parser_history = subparsers.add_parser("history", help="View export history")
+    parser_history = subparsers.add_parser("history", parents=[_db_path_parent()], help=COMMAND_HELP["history"])
     parser_history.add_argument("--session", type=str, help="Show details for a specific session")
-    parser_history.add_argument("--format", type=str, choices=["json", "csv"], help="Output format for history")
+    parser_history.add_argument("--format", type=str, choices=HISTORY_FORMATS, help="Output format for history")
     parser_history.add_argument("--details", action="store_true", help="Show detailed session details")
     parser_history.add_argument("--limit", type=int, help="Limit the number of history entries to display")
-    parser_history.add_argument(
-        "--db-path",
-        type=str,
-        help="Path to the SQLite database (default: from config or database directory).",
-    )
-    parser_history.set_defaults(func=handle_history)
 
 
 def _setup_highlights_command(subparsers):
     """Set up the highlights command and its subcommands."""
-    from .commands.highlights import handle_highlights
-
-    parser_highlights = subparsers.add_parser("highlights", help="Manage stored highlights")
+    parser_highlights = subparsers.add_parser("highlights", help=COMMAND_HELP["highlights"])
     highlights_subparsers = parser_highlights.add_subparsers(
-        dest="highlights_command", help="Highlight management commands"
+        dest="highlights_command", metavar="SUBCOMMAND", help="Highlight management commands"
     )
 
     # Highlights list subcommand
     parser_highlights_list = highlights_subparsers.add_parser("list", help="List and search highlights in the database")
-    parser_highlights_list.add_argument("--title", type=str, help="Filter by book title (partial match)")
-    parser_highlights_list.add_argument("--author", type=str, help="Filter by author (partial match)")
+    parser_highlights_list.add_argument(
+        "--title", type=str, help="Filter by book title (exact; a trailing * scans for a case-insensitive prefix)"
+    )
+    parser_highlights_list.add_argument(
+        "--title-prefix", type=str, help="Filter by book title prefix (case-sensitive, uses the title index)"
+    )
+    parser_highlights_list.add_argument("--author", type=str, help="Filter by author (exact match)")
+    parser_highlights_list.add_argument("--author-prefix", type=str, help="Filter by author prefix (case-sensitive)")
     parser_highlights_list.add_argument("--text", type=str, help="Search in highlight text (partial match)")
     parser_highlights_list.add_argument("--limit", type=int, default=20, help="Maximum number of results (default: 20)")
     parser_highlights_list.add_argument(
-        "--offset", type=int, default=0, help="Results offset for pagination (default: 0)"
+        "--after", type=str, metavar="CURSOR", help="Show the page after this cursor (printed after each full page)"
+    )
+    parser_highlights_list.add_argument(
+        "--offset", type=int, help="Results offset for pagination (deprecated, use --after)"
     )
     parser_highlights_list.add_argument(
         "--sort",
         type=str,
         default="date_exported",
-        choices=["date_exported", "date_highlighted", "title", "author"],
+        choices=SORT_FIELDS,
         help="Field to sort by (default: date_exported)",
     )
     parser_highlights_list.add_argument(
-        "--order", type=str, default="desc", choices=["asc", "desc"], help="Sort direction (default: desc)"
+        "--order", type=str, default="desc", choices=SORT_DIRECTIONS, help="Sort direction (default: desc)"
+    )
+    parser_highlights_list.add_argument(
+        "--format", type=str, choices=OUTPUT_FORMATS, help="Output format (default: text)"
+    )
+    parser_highlights_list.add_argument(
+        "--no-total", action="store_true", help="Skip counting all matches (faster on large databases)"
     )
     parser_highlights_list.add_argument(
-        "--format", type=str, choices=["text", "json", "csv"], help="Output format (default: text)"
+        "--stream", action="store_true", help="With --format json, write one JSON object per line (NDJSON)"
     )
 
     # Highlights books subcommand
     parser_highlights_books = highlights_subparsers.add_parser("books", help="List all books with highlight counts")
     parser_highlights_books.add_argument(
-        "--format", type=str, choices=["text", "json", "csv"], help="Output format (default: text)"
+        "--format", type=str, choices=OUTPUT_FORMATS, help="Output format (default: text)"
     )
 
     # Highlights delete subcommand
     parser_highlights_delete = highlights_subparsers.add_parser("delete", help="Delete highlights or books")
-    delete_group = parser_highlights_delete.add_mutually_exclusive_group(required=True)
-    delete_group.add_argument("--id", type=int, help="Delete a single highlight by ID")
-    delete_group.add_argument("--book", type=str, help="Delete all highlights for a specific book")
+    # Exactly one of --id/--book is required; checked by the handler rather than an argparse group
+    parser_highlights_delete.add_argument("--id", type=int, help="Delete a single highlight by ID")
+    parser_highlights_delete.add_argument("--book", type=str, help="Delete all highlights for a specific book")
     parser_highlights_delete.add_argument("--author", type=str, help="Author name (when deleting by book)")
     parser_highlights_delete.add_argument("--force", "-f", action="store_true", help="Skip confirmation prompt")
 
-    # Set default handler for the main highlights command
-    parser_highlights.set_defaults(func=handle_highlights)
-
 
 def _setup_version_command(subparsers):
     """Set up the version command."""
-    from .commands.version import handle_version
-
-    parser_version = subparsers.add_parser("version", help="Show version information")
-    parser_version.set_defaults(func=handle_version)
+    subparsers.add_parser("version", help=COMMAND_HELP["version"])
 
 
 def _setup_reset_db_command(subparsers):
     """Set up the reset-db command and its options."""
-    from .commands.reset_db import handle_reset_db
-
-    parser_reset_db = subparsers.add_parser("reset-db", help="Reset the database")
+    parser_reset_db = subparsers.add_parser("reset-db", help=COMMAND_HELP["reset-db"])
     parser_reset_db.add_argument("--force", "-f", action="store_true", help="Force reset of the database")
-    parser_reset_db.set_defaults(func=handle_reset_db)
+
+
+_COMMAND_SETUP = {
+    "export": _setup_export_command,
+    "config": _setup_config_command,
+    "history": _setup_history_command,
+    "highlights": _setup_highlights_command,
+    "version": _setup_version_command,
+    "reset-db": _setup_reset_db_command,
+}
+
+# Handler for each subcommand; config and highlights dispatch their own subcommands
+COMMAND_HANDLERS = {
+    "export": _lazy_handler("export", "handle_export"),
+    "config": _lazy_handler("config", "handle_configure"),
+    "history": _lazy_handler("history", "handle_history"),
+    "highlights": _lazy_handler("highlights", "handle_highlights"),
+    "version": _lazy_handler("version", "handle_version"),
+    "reset-db": _lazy_handler("reset_db", "handle_reset_db"),
+}
+
+# Argument-free invocations handled by _fast_parse: argv -> namespace fields
+_FAST_PATHS = {
+    ("version",): {"command": "version"},
+    ("config",): {"command": "config", "config_command": None},
+    ("config", "show"): {"command": "config", "config_command": "show"},
+    ("config", "paths"): {"command": "config", "config_command": "paths"},
+}
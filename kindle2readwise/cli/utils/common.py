@@ -2,6 +2,7 @@
 
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from ...config import get_readwise_token
@@ -13,41 +14,34 @@ DEFAULT_CLIPPINGS_PATH = "My Clippings.txt"
 logger = logging.getLogger(__name__)
 
 
-def get_api_token_from_env() -> str | None:
-    """Get the Readwise API token from environment variables.
-
-    Returns:
-        API token if found, None otherwise
-    """
-    return os.environ.get(READWISE_TOKEN_ENV_VAR)
-
-
 def get_readwise_token_cli(args) -> str | None:
-    """Get Readwise token from args, environment variable, or config."""
-    # First try command line argument
-    if hasattr(args, "api_token") and args.api_token:
-        logger.debug("Using Readwise API token from command line argument.")
-        return args.api_token
-
-    # Then try environment variable
-    token_from_env = os.environ.get(READWISE_TOKEN_ENV_VAR)
-    if token_from_env:
-        logger.debug("Using Readwise API token from environment variable %s.", READWISE_TOKEN_ENV_VAR)
-        return token_from_env
+    """Get Readwise token from args, environment variable, or config.
 
-    # Finally try configured token
-    token_from_config = get_readwise_token()
-    if token_from_config:
-        logger.debug("Using Readwise API token from configuration.")
-        return token_from_config
+    Sources are tried in that order and the first non-empty token wins; the
+    configured token is only read from disk when the other two are unset.
+    """
+    sources = (
+        ("command line argument", lambda: getattr(args, "api_token", None)),
+        (f"environment variable {READWISE_TOKEN_ENV_VAR}", lambda: os.environ.get(READWISE_TOKEN_ENV_VAR)),
+        ("configuration", get_readwise_token),
+    )
+    for source, getter in sources:
+        token = getter()
+        if token:
+            logger.debug("Using Readwise API token from %s.", source)
+            return token
 
     logger.debug("Readwise API token not found in args, environment variable, or configuration.")
     return None
 
 
-def get_default_clippings_path() -> str | None:
+@lru_cache(maxsize=1)
+def get_default_clippings_path() -> Path | None:
     """Get the default path to the Kindle clippings file.
 
+    The filesystem probes run once per process; call
+    ``get_default_clippings_path.cache_clear()`` to probe again (e.g. after mounting a Kindle).
+
     Returns:
         Path to the clippings file if found, None otherwise
     """
@@ -57,13 +51,13 @@ def get_default_clippings_path() -> str | None:
     kindle_clippings = find_kindle_clippings()
     if kindle_clippings:
         logger.info("Automatically detected Kindle clippings file: %s", kindle_clippings)
-        return str(kindle_clippings)
+        return kindle_clippings
 
     # Check current directory as fallback
-    current_dir = Path.cwd() / "My Clippings.txt"
-    if current_dir.exists():
+    if os.path.exists(DEFAULT_CLIPPINGS_PATH):
+        current_dir = Path(os.path.abspath(DEFAULT_CLIPPINGS_PATH))
         logger.debug("Found clippings file in current directory: %s", current_dir)
-        return str(current_dir)
+        return current_dir
 
     logger.debug("No Kindle clippings file found automatically")
     return None
@@ -1,20 +1,75 @@
 """Output formatting utilities for CLI commands."""
 
 import csv
-import io
 import json
+from collections.abc import Iterable
 from datetime import datetime
+from functools import lru_cache
+from typing import Any, TextIO
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up for JSON output; not a required dependency
+    orjson = None
 
 # Constants for UI display formatting
 BOOK_TITLE_MAX_LENGTH = 37
-BOOK_TITLE_TRUNCATE_LENGTH = 34
 BOOK_AUTHOR_MAX_LENGTH = 27
-BOOK_AUTHOR_TRUNCATE_LENGTH = 24
 TABLE_WIDTH = 82
 MAX_SOURCE_FILE_LENGTH = 30
 MAX_TITLE_LENGTH = 30
 MAX_AUTHOR_LENGTH = 20
 MAX_HIGHLIGHTS_PREVIEW = 10
+DISPLAY_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+TRUNCATION_SUFFIX = "..."
+# Column layout of the export history table, shared by its header and rows
+HISTORY_ROW_FORMAT = "{:<5} {:<20} {:<10} {:<8} {:<8} {:<8} {:<30}"
+HISTORY_HEADER = HISTORY_ROW_FORMAT.format("ID", "Date", "Status", "Total", "New", "Dupes", "Source File")
+HISTORY_SEPARATOR = "-" * 90
+# Column layout of the highlight preview in a single session's details
+SESSION_HIGHLIGHT_ROW_FORMAT = "{:<30} {:<20} {:<10}"
+SESSION_HIGHLIGHT_HEADER = SESSION_HIGHLIGHT_ROW_FORMAT.format("Title", "Author", "Status")
+SESSION_HIGHLIGHT_SEPARATOR = "-" * 70
+
+
+def truncate_text(text: str, max_length: int) -> str:
+    """Shorten text to at most ``max_length`` characters, ending in an ellipsis when cut."""
+    if len(text) <= max_length:
+        return text
+    return text[: max_length - len(TRUNCATION_SUFFIX)] + TRUNCATION_SUFFIX
+
+
+@lru_cache(maxsize=1024)
+def _parse_timestamp(timestamp: str) -> datetime | None:
+    """Parse an ISO timestamp, returning None if it cannot be parsed.
+
+    Cached because the history table and the ``--details`` block parse the same session times.
+    """
+    try:
+        return datetime.fromisoformat(timestamp)
+    except (ValueError, TypeError):
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _format_timestamp(timestamp: str) -> str:
+    """Reformat an ISO timestamp for display, returning it unchanged if it cannot be parsed.
+
+    Cached because rows from the same export session share their timestamps.
+    """
+    parsed = _parse_timestamp(timestamp)
+    return timestamp if parsed is None else parsed.strftime(DISPLAY_DATE_FORMAT)
+
+
+def dumps_json(obj: Any) -> str:
+    """Serialize ``obj`` as indented JSON, using orjson when it is installed.
+
+    Both backends produce the same layout and leave non-ASCII text unescaped; values JSON
+    cannot represent are converted with ``str``.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, default=str, ensure_ascii=False)
 
 
 def format_export_summary(stats, clippings_file, dry_run: bool) -> str:
@@ -37,28 +92,48 @@ def format_export_summary(stats, clippings_file, dry_run: bool) -> str:
     return "\n".join(output)
 
 
+def format_pending_highlights(pending_highlights: list[dict]) -> str:
+    """Format the highlights awaiting selection in interactive export mode, grouped by book."""
+    output = ["\n=== Interactive Export Mode ===", f"Found {len(pending_highlights)} new highlights to export.\n"]
+
+    # Group highlights by book, formatting each book's heading only once
+    books: dict[tuple[str, str], list[dict]] = {}
+    for highlight in pending_highlights:
+        books.setdefault((highlight["title"], highlight["author"]), []).append(highlight)
+
+    for (title, author), highlights in books.items():
+        output.append(f"\n📚 {title} - {author}")
+        output.append("-" * 80)
+        for highlight in highlights:
+            output.append(f"  [{highlight['id']}] {highlight['highlight'][:100]}...")
+            output.append(f"      Location: {highlight['location']}, Date: {highlight['date']}")
+            output.append("")
+
+    # Instructions for selection
+    output.append("\nSelect highlights to export:")
+    output.append("  - Enter highlight IDs separated by commas (e.g., '1,3,5')")
+    output.append("  - Enter 'a' to select all highlights")
+    output.append("  - Enter 'q' to quit without exporting")
+
+    return "\n".join(output)
+
+
 def format_history_table(history: list[dict]) -> str:
     """Display export history in a formatted table."""
     if not history:
         return "No export history found."
 
-    output = ["\n--- Export History ---"]
-    output.append(f"{'ID':<5} {'Date':<20} {'Status':<10} {'Total':<8} {'New':<8} {'Dupes':<8} {'Source File':<30}")
-    output.append("-" * 90)
+    output = ["\n--- Export History ---", HISTORY_HEADER, HISTORY_SEPARATOR]
 
-    # Print each session
+    # Print each session, totalling new highlights as we go
+    total_highlights = 0
     for session in history:
+        new = session.get("highlights_new", 0)
+        total_highlights += new
+
         # Format the date for display
         start_time = session.get("start_time", "")
-        if start_time:
-            try:
-                # Parse ISO format datetime and format for display
-                dt = datetime.fromisoformat(start_time)
-                formatted_date = dt.strftime("%Y-%m-%d %H:%M:%S")
-            except (ValueError, TypeError):
-                formatted_date = start_time
-        else:
-            formatted_date = "Unknown"
+        formatted_date = _format_timestamp(start_time) if start_time else "Unknown"
 
         # Format source file (truncate if too long)
         source_file = session.get("source_file", "")
@@ -67,18 +142,19 @@ def format_history_table(history: list[dict]) -> str:
 
         # Format the row
         output.append(
-            f"{session.get('id', 0):<5} "
-            f"{formatted_date:<20} "
-            f"{session.get('status', ''):<10} "
-            f"{session.get('highlights_total', 0):<8} "
-            f"{session.get('highlights_new', 0):<8} "
-            f"{session.get('highlights_dupe', 0):<8} "
-            f"{source_file:<30}"
+            HISTORY_ROW_FORMAT.format(
+                session.get("id", 0),
+                formatted_date,
+                session.get("status", ""),
+                session.get("highlights_total", 0),
+                new,
+                session.get("highlights_dupe", 0),
+                source_file,
+            )
         )
 
     # Print summary
-    total_highlights = sum(session.get("highlights_new", 0) for session in history)
-    output.append("-" * 90)
+    output.append(HISTORY_SEPARATOR)
     output.append(f"Total Exported: {total_highlights} highlights across {len(history)} sessions")
 
     return "\n".join(output)
@@ -99,11 +175,11 @@ def format_session_details(session: dict) -> str:
     # Calculate duration if both times are available
     duration = "Unknown"
     if start_time != "Unknown" and end_time != "Unknown":
+        start_dt = _parse_timestamp(start_time)
+        end_dt = _parse_timestamp(end_time)
         try:
-            start_dt = datetime.fromisoformat(start_time)
-            end_dt = datetime.fromisoformat(end_time)
             duration = str(end_dt - start_dt)
-        except (ValueError, TypeError):
+        except TypeError:  # Unparsable time, or a naive and an aware one
             pass
 
     output = [f"\nSession ID: {session_id}"]
@@ -119,11 +195,19 @@ def format_session_details(session: dict) -> str:
     return "\n".join(output)
 
 
-def format_highlights_text(highlights: list[dict], count: int, limit: int, offset: int) -> str:
-    """Format highlights in text format."""
-    output = [f"\nFound {count} highlights total"]
-    if count > limit:
-        output.append(f"Displaying {len(highlights)} highlights (offset: {offset}, limit: {limit})")
+def format_highlights_text(
+    highlights: list[dict], count: int | None, limit: int, offset: int, next_cursor: str | None = None
+) -> str:
+    """Format highlights in text format, ending with the cursor for the next page if there is one.
+
+    A ``count`` of None means the total was not computed; only the page size is reported then.
+    """
+    if count is None:
+        output = [f"\nShowing {len(highlights)} highlights (offset: {offset}, limit: {limit})"]
+    else:
+        output = [f"\nFound {count} highlights total"]
+        if count > limit:
+            output.append(f"Displaying {len(highlights)} highlights (offset: {offset}, limit: {limit})")
 
     output.append("\n" + "=" * 80)
 
@@ -137,11 +221,7 @@ def format_highlights_text(highlights: list[dict], count: int, limit: int, offse
 
         # Format date if available
         if date_highlighted and date_highlighted != "Unknown":
-            try:
-                dt = datetime.fromisoformat(date_highlighted)
-                date_highlighted = dt.strftime("%Y-%m-%d %H:%M:%S")
-            except (ValueError, TypeError):
-                pass
+            date_highlighted = _format_timestamp(date_highlighted)
 
         output.append(f"Title: {title}")
         output.append(f"Author: {author}")
@@ -150,38 +230,62 @@ def format_highlights_text(highlights: list[dict], count: int, limit: int, offse
         output.append(f"Text: {text}")
         output.append("-" * 80)
 
+    if next_cursor:
+        output.append(f"Next page: --after {next_cursor}")
+
     return "\n".join(output)
 
 
-def format_highlights_json(highlights: list[dict], count: int, limit: int, offset: int) -> str:
-    """Format highlights as JSON."""
-    result = {"count": count, "limit": limit, "offset": offset, "highlights": highlights}
-    return json.dumps(result, indent=2, default=str)
+def write_highlights_json(
+    highlights: Iterable[dict], count: int | None, limit: int, offset: int, stream: TextIO
+) -> None:
+    """Write highlights as JSON to ``stream`` one record at a time.
+
+    The output matches ``dumps_json`` of the full result object, without
+    holding every highlight (or the whole document) in memory. A ``count``
+    of None (total not computed) is written as ``null``.
+    """
+    stream.write(
+        f'{{\n  "count": {json.dumps(count)},\n  "limit": {limit},\n  "offset": {offset},\n  "highlights": ['
+    )
+    separator = "\n    "
+    for h in highlights:
+        stream.write(separator + dumps_json(h).replace("\n", "\n    "))
+        separator = ",\n    "
+    # An empty list stays on one line, as json.dumps would render it
+    stream.write("]\n}\n" if separator == "\n    " else "\n  ]\n}\n")
+
+
+def write_highlights_ndjson(highlights: Iterable[dict], stream: TextIO) -> None:
+    """Write highlights to ``stream`` as newline-delimited JSON, one compact object per line."""
+    if orjson is not None:
+        stream.writelines(orjson.dumps(h, default=str).decode() + "\n" for h in highlights)
+    else:
+        stream.writelines(
+            json.dumps(h, default=str, ensure_ascii=False, separators=(",", ":")) + "\n" for h in highlights
+        )
 
 
-def format_highlights_csv(highlights: list[dict]) -> str:
-    """Format highlights as CSV."""
-    output = io.StringIO()
-    writer = csv.writer(output)
+def write_highlights_csv(highlights: Iterable[dict], stream: TextIO) -> None:
+    """Write highlights as CSV straight to ``stream``."""
+    writer = csv.writer(stream)
 
     # Write header
     writer.writerow(["ID", "Title", "Author", "Text", "Location", "Date Highlighted", "Date Exported"])
 
     # Write data
-    for h in highlights:
-        writer.writerow(
-            [
-                h.get("id", ""),
-                h.get("title", ""),
-                h.get("author", ""),
-                h.get("text", ""),
-                h.get("location", ""),
-                h.get("date_highlighted", ""),
-                h.get("date_exported", ""),
-            ]
+    writer.writerows(
+        (
+            h.get("id", ""),
+            h.get("title", ""),
+            h.get("author", ""),
+            h.get("text", ""),
+            h.get("location", ""),
+            h.get("date_highlighted", ""),
+            h.get("date_exported", ""),
         )
-
-    return output.getvalue()
+        for h in highlights
+    )
 
 
 def format_books_text(books: list[dict]) -> str:
@@ -191,13 +295,8 @@ def format_books_text(books: list[dict]) -> str:
     output.append("-" * TABLE_WIDTH)
 
     for book in books:
-        title = book.get("title", "Unknown")
-        if len(title) > BOOK_TITLE_MAX_LENGTH:
-            title = title[:BOOK_TITLE_TRUNCATE_LENGTH] + "..."
-
-        author = book.get("author", "Unknown")
-        if len(author) > BOOK_AUTHOR_MAX_LENGTH:
-            author = author[:BOOK_AUTHOR_TRUNCATE_LENGTH] + "..."
+        title = truncate_text(book.get("title", "Unknown"), BOOK_TITLE_MAX_LENGTH)
+        author = truncate_text(book.get("author", "Unknown"), BOOK_AUTHOR_MAX_LENGTH)
 
         count = book.get("highlight_count", 0)
 
@@ -24,9 +24,16 @@ DEFAULT_CONFIG = {
     "database_path": "",  # Will be auto-populated based on config_dir
 }
 
+# Placeholder shown by list_config when no Readwise token is stored
+TOKEN_NOT_SET = "[Not Set]"
 
+
+@lru_cache(maxsize=1)
 def get_config_dir() -> Path:
-    """Get the platform-specific configuration directory."""
+    """Get the platform-specific configuration directory.
+
+    Resolved (and created) once per process; the platform and home directory don't change.
+    """
     system = platform.system()
     home = Path.home()
 
@@ -42,16 +49,18 @@ def get_config_dir() -> Path:
     return config_dir
 
 
+@lru_cache(maxsize=1)
 def get_data_dir() -> Path:
-    """Get the platform-specific data directory."""
+    """Get the platform-specific data directory, resolved once per process."""
     config_dir = get_config_dir()
     data_dir = config_dir / "data"
     data_dir.mkdir(exist_ok=True)
     return data_dir
 
 
+@lru_cache(maxsize=1)
 def get_credentials_dir() -> Path:
-    """Get the directory for storing credentials."""
+    """Get the directory for storing credentials, resolved once per process."""
     config_dir = get_config_dir()
     creds_dir = config_dir / "credentials"
     creds_dir.mkdir(exist_ok=True)
@@ -70,22 +79,30 @@ def get_config_file_path() -> Path:
 
 
 def load_config() -> dict[str, Any]:
-    """Load configuration from file or create with defaults if not exists."""
-    config_file = get_config_file_path()
+    """Load configuration from file or create with defaults if not exists.
 
+    The file is read once per process; ``save_config`` invalidates the cached contents.
+    Each call returns a fresh copy that the caller may modify.
+    """
+    return _load_config_file(get_config_file_path()).copy()
+
+
+@lru_cache(maxsize=4)
+def _load_config_file(config_file: Path) -> dict[str, Any]:
+    """Read and merge the configuration stored in ``config_file``; use ``load_config`` instead."""
     # If config file exists, load it
     if config_file.exists():
         try:
             with open(config_file) as f:
                 config = json.load(f)
-            logger.debug(f"Loaded configuration from {config_file}")
+            logger.debug("Loaded configuration from %s", config_file)
 
             # Merge with defaults to ensure all keys exist
             merged_config = DEFAULT_CONFIG.copy()
             merged_config.update(config)
             return merged_config
         except Exception as e:
-            logger.error(f"Error loading configuration: {e}")
+            logger.error("Error loading configuration: %s", e)
             logger.info("Using default configuration instead")
             return DEFAULT_CONFIG.copy()
 
@@ -114,10 +131,11 @@ def save_config(config: dict[str, Any]) -> bool:
     try:
         with open(config_file, "w") as f:
             json.dump(config, f, indent=2)
-        logger.debug(f"Saved configuration to {config_file}")
+        logger.debug("Saved configuration to %s", config_file)
+        _load_config_file.cache_clear()
         return True
     except Exception as e:
-        logger.error(f"Error saving configuration: {e}")
+        logger.error("Error saving configuration: %s", e)
         return False
 
 
@@ -167,13 +185,17 @@ def set_readwise_token(token: str) -> bool:
         logger.warning("Attempting to store empty API token")
         return False
 
-    logger.info(f"Storing Readwise API token {mask_token(token)}")
+    logger.info("Storing Readwise API token %s", mask_token(token))
+    get_readwise_token.cache_clear()
     return save_token_to_file(token, token_file)
 
 
+@lru_cache(maxsize=1)
 def get_readwise_token() -> str:
     """Retrieve the stored Readwise API token.
 
+    The token file is read once per process; ``set_readwise_token`` invalidates the cached value.
+
     Returns:
         str: The stored token or empty string if not set
     """
@@ -181,7 +203,7 @@ def get_readwise_token() -> str:
     token = load_token_from_file(token_file)
 
     if token:
-        logger.debug(f"Retrieved Readwise API token: {mask_token(token)}")
+        logger.debug("Retrieved Readwise API token: %s", mask_token(token))
     else:
         logger.debug("No Readwise API token found")
 
@@ -221,14 +243,14 @@ def list_config() -> dict[str, Any]:
     Returns:
         Dict[str, Any]: Configuration values safe for display
     """
-    config = load_config()
-    display_config = config.copy()
+    # load_config already returns a private copy, so it can be amended for display directly
+    display_config = load_config()
 
     # Add the token (masked) for display
     token = get_readwise_token()
     if token:
         display_config["readwise_token"] = mask_token(token)
     else:
-        display_config["readwise_token"] = "[Not Set]"
+        display_config["readwise_token"] = TOKEN_NOT_SET
 
     return display_config
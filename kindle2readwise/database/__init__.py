@@ -1,5 +1,17 @@
 """Database module for kindle2readwise."""
 
-from .db_manager import DEFAULT_DB_PATH, HighlightsDAO, generate_highlight_hash
+from .db_manager import (
+    DEFAULT_DB_PATH,
+    HighlightsDAO,
+    decode_highlight_cursor,
+    encode_highlight_cursor,
+    generate_highlight_hash,
+)
 
-__all__ = ["DEFAULT_DB_PATH", "HighlightsDAO", "generate_highlight_hash"]
+__all__ = [
+    "DEFAULT_DB_PATH",
+    "HighlightsDAO",
+    "decode_highlight_cursor",
+    "encode_highlight_cursor",
+    "generate_highlight_hash",
+]
@@ -1,6 +1,11 @@
+import base64
+import binascii
 import hashlib
+import json
 import logging
+from collections.abc import Iterator
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +18,68 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_DB_PATH = Path.cwd() / "data" / "kindle2readwise.db"
 
+# Columns and directions accepted for sorting highlights; anything else falls back to newest first
+SORT_FIELDS = ("date_exported", "date_highlighted", "title", "author")
+SORT_DIRECTIONS = ("asc", "desc")
+
+# Alias for the windowed match count added to rows by iter_highlights_with_total
+_TOTAL_COLUMN = "_total_matches"
+
+# LIKE wildcards (and the escape character itself) are escaped with a backslash, declared via ESCAPE '\'
+_LIKE_ESCAPES = str.maketrans({"\\": "\\\\", "%": "\\%", "_": "\\_"})
+
+# GLOB has no escape character; a metacharacter is matched literally inside a bracket expression
+_GLOB_ESCAPES = str.maketrans({"*": "[*]", "?": "[?]", "[": "[[]"})
+
+
+def encode_highlight_cursor(row: dict[str, Any], sort_by: str, sort_dir: str) -> str:
+    """Encode the position of a highlight in a sorted listing as an opaque page cursor.
+
+    Args:
+        row: The last highlight of the current page
+        sort_by: Field the listing is sorted by
+        sort_dir: Sort direction of the listing
+
+    Returns:
+        A URL-safe cursor for the ``after`` argument of the highlight queries
+    """
+    position = [sort_by, sort_dir.lower(), row.get(sort_by), row.get("id")]
+    return base64.urlsafe_b64encode(json.dumps(position).encode("utf-8")).decode("ascii")
+
+
+def decode_highlight_cursor(cursor: str, sort_by: str, sort_dir: str) -> tuple[Any, int]:
+    """Decode a page cursor created by ``encode_highlight_cursor``.
+
+    Args:
+        cursor: The cursor to decode
+        sort_by: Field the listing is sorted by
+        sort_dir: Sort direction of the listing
+
+    Returns:
+        Tuple of (sort key, id) of the last highlight before the requested page
+
+    Raises:
+        ValueError: If the cursor is malformed or was created for a different sort order
+    """
+    try:
+        cursor_sort_by, cursor_sort_dir, sort_key, last_id = json.loads(base64.urlsafe_b64decode(cursor))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        raise ValueError(f"Invalid page cursor: {cursor}") from e
+
+    if (cursor_sort_by, cursor_sort_dir) != (sort_by, sort_dir.lower()):
+        raise ValueError(f"Page cursor was created for a listing sorted by {cursor_sort_by} {cursor_sort_dir}")
+    return sort_key, last_id
+
+
+def _escape_like(text: str) -> str:
+    """Escape LIKE wildcards so ``text`` only matches itself in a ``LIKE ? ESCAPE '\\'`` clause."""
+    return text.translate(_LIKE_ESCAPES)
+
+
+def _escape_glob(text: str) -> str:
+    """Escape GLOB wildcards so ``text`` only matches itself."""
+    return text.translate(_GLOB_ESCAPES)
+
 
 def generate_highlight_hash(title: str, author: str | None, text: str) -> str:
     """Generate a unique SHA-256 hash for a highlight based on its core content."""
@@ -293,17 +360,24 @@ class HighlightsDAO:
         offset: int = 0,
         sort_by: str = "date_exported",
         sort_dir: str = "desc",
+        after: str | tuple[Any, int] | None = None,
+        title_prefix: str | None = None,
+        author_prefix: str | None = None,
     ) -> list[dict[str, Any]]:
         """Get highlights with optional filtering.
 
         Args:
-            title: Filter by book title (partial match)
-            author: Filter by author (partial match)
-            text_search: Search in highlight text (partial match)
+            title: Filter by book title (exact, or prefix when ending in ``*``)
+            author: Filter by author (exact match)
+            text_search: Search in highlight text (substring match)
             limit: Maximum number of results to return
             offset: Number of results to skip (for pagination)
             sort_by: Field to sort by (date_exported, date_highlighted, title, author)
             sort_dir: Sort direction (asc, desc)
+            after: Cursor from ``encode_highlight_cursor``, or the (sort key, id) pair it decodes to;
+                only highlights after it are returned
+            title_prefix: Filter by book title prefix (case-sensitive, can use the title index)
+            author_prefix: Filter by author prefix (case-sensitive)
 
         Returns:
             List of filtered highlight records
@@ -316,65 +390,292 @@ class HighlightsDAO:
             offset=offset,
             sort_by=sort_by,
             sort_dir=sort_dir,
+            after=after,
+            title_prefix=title_prefix,
+            author_prefix=author_prefix,
         )
         return self._get_highlights_with_filters(filters)
 
-    def _get_highlights_with_filters(self, filters: HighlightFilters) -> list[dict[str, Any]]:
-        """Internal implementation of retrieving highlights with filters.
+    def get_highlights_with_total(  # noqa: PLR0913
+        self,
+        title: str | None = None,
+        author: str | None = None,
+        text_search: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        sort_by: str = "date_exported",
+        sort_dir: str = "desc",
+        after: str | tuple[Any, int] | None = None,
+        title_prefix: str | None = None,
+        author_prefix: str | None = None,
+        with_total: bool = True,
+    ) -> tuple[list[dict[str, Any]], int | None]:
+        """Get a page of filtered highlights together with the total number of matches.
 
         Args:
-            filters: Filters for highlights
+            title: Filter by book title (exact, or prefix when ending in ``*``)
+            author: Filter by author (exact match)
+            text_search: Search in highlight text (substring match)
+            limit: Maximum number of results to return
+            offset: Number of results to skip (for pagination)
+            sort_by: Field to sort by (date_exported, date_highlighted, title, author)
+            sort_dir: Sort direction (asc, desc)
+            after: Cursor from ``encode_highlight_cursor``, or the (sort key, id) pair it decodes to;
+                only highlights after it are returned
+            title_prefix: Filter by book title prefix (case-sensitive, can use the title index)
+            author_prefix: Filter by author prefix (case-sensitive)
+            with_total: Whether to count all matching highlights; skipping it avoids a full scan
 
         Returns:
-            List of filtered highlight records
+            Tuple of (page of highlight records, total number of matching highlights or None)
         """
-        logger.debug(
-            "Retrieving highlights with filters: title=%s, author=%s, text_search=%s",
-            filters.title,
-            filters.author,
-            filters.text_search,
+        highlights, total = self.iter_highlights_with_total(
+            title=title,
+            author=author,
+            text_search=text_search,
+            limit=limit,
+            offset=offset,
+            sort_by=sort_by,
+            sort_dir=sort_dir,
+            after=after,
+            title_prefix=title_prefix,
+            author_prefix=author_prefix,
+            with_total=with_total,
+        )
+        highlights = list(highlights)
+        logger.debug("Retrieved %d of %s matching highlights", len(highlights), total)
+        return highlights, total
+
+    def iter_highlights_with_total(  # noqa: PLR0913
+        self,
+        title: str | None = None,
+        author: str | None = None,
+        text_search: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        sort_by: str = "date_exported",
+        sort_dir: str = "desc",
+        after: str | tuple[Any, int] | None = None,
+        title_prefix: str | None = None,
+        author_prefix: str | None = None,
+        with_total: bool = True,
+    ) -> tuple[Iterator[dict[str, Any]], int | None]:
+        """Stream a page of filtered highlights together with the total number of matches.
+
+        The total is computed in the same query with a ``COUNT(*) OVER ()`` window and read from
+        the first row, so only that row is fetched up front; the rest are read from the cursor
+        as the returned iterator is consumed. Past an ``after`` cursor the window would only see
+        the remaining rows, so the total is then counted separately.
+
+        Args:
+            title: Filter by book title (exact, or prefix when ending in ``*``)
+            author: Filter by author (exact match)
+            text_search: Search in highlight text (substring match)
+            limit: Maximum number of results to return
+            offset: Number of results to skip (for pagination)
+            sort_by: Field to sort by (date_exported, date_highlighted, title, author)
+            sort_dir: Sort direction (asc, desc)
+            after: Cursor from ``encode_highlight_cursor``, or the (sort key, id) pair it decodes to;
+                only highlights after it are returned
+            title_prefix: Filter by book title prefix (case-sensitive, can use the title index)
+            author_prefix: Filter by author prefix (case-sensitive)
+            with_total: Whether to count all matching highlights; skipping it avoids a full scan
+
+        Returns:
+            Tuple of (iterator over highlight records, total number of matching highlights or None)
+        """
+        filters = HighlightFilters(
+            title=title,
+            author=author,
+            text_search=text_search,
+            limit=limit,
+            offset=offset,
+            sort_by=sort_by,
+            sort_dir=sort_dir,
+            after=after,
+            title_prefix=title_prefix,
+            author_prefix=author_prefix,
+        )
+        where_clause, params = self._build_page_where(filters)
+        where_sql = f"WHERE {where_clause}" if where_clause else ""
+        # Past a cursor the window would only count the remaining rows
+        count_in_query = with_total and not filters.after
+        window_sql = f", COUNT(*) OVER () AS {_TOTAL_COLUMN}" if count_in_query else ""
+        query = (
+            f"SELECT *{window_sql} FROM highlights {where_sql} "
+            f"ORDER BY {self._build_order_by(filters.sort_by, filters.sort_dir)} LIMIT ? OFFSET ?"
         )
 
-        # Build the WHERE clause and parameters
+        try:
+            rows = self.db.query(query, [*params, filters.limit, filters.offset])
+            first = next(rows, None)
+        except Exception as e:
+            logger.error("Failed to retrieve highlights: %s", e, exc_info=True)
+            return iter(()), 0
+
+        if not count_in_query:
+            total = (
+                self.get_highlight_count_with_filters(title, author, text_search, title_prefix, author_prefix)
+                if with_total
+                else None
+            )
+            return (iter(()) if first is None else chain((first,), rows)), total
+
+        if first is None:
+            # An offset past the last match returns no rows to carry the total
+            total = (
+                self.get_highlight_count_with_filters(title, author, text_search, title_prefix, author_prefix)
+                if filters.offset
+                else 0
+            )
+            return iter(()), total
+
+        def strip_total(rows: Iterator[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+            for row in rows:
+                del row[_TOTAL_COLUMN]
+                yield row
+
+        return strip_total(chain((first,), rows)), first[_TOTAL_COLUMN]
+
+    @staticmethod
+    def _build_highlight_where(
+        title: str | None,
+        author: str | None,
+        text_search: str | None,
+        title_prefix: str | None = None,
+        author_prefix: str | None = None,
+    ) -> tuple[str | None, list[Any]]:
+        """Build the WHERE clause and parameters shared by the highlight queries.
+
+        Args:
+            title: Filter by book title (exact, or prefix when ending in ``*``)
+            author: Filter by author (exact match)
+            text_search: Search in highlight text (substring match)
+            title_prefix: Filter by book title prefix (case-sensitive)
+            author_prefix: Filter by author prefix (case-sensitive)
+
+        Returns:
+            Tuple of (WHERE clause without the keyword or None if unfiltered, parameters)
+        """
         where_clauses = []
         params = []
 
-        if filters.title:
+        if title:
             # Handle wildcard search with * at the end (commonly used pattern)
-            if filters.title.endswith("*"):
-                where_clauses.append("title LIKE ?")
-                params.append(f"{filters.title[:-1]}%")  # Replace * with SQL wildcard %
+            if title.endswith("*"):
+                where_clauses.append("title LIKE ? ESCAPE '\\'")
+                params.append(f"{_escape_like(title[:-1])}%")  # Replace * with SQL wildcard %
             else:
                 # Exact match if no wildcard
                 where_clauses.append("title = ?")
-                params.append(filters.title)
+                params.append(title)
 
-        if filters.author:
+        if author:
             # Exact match for author
             where_clauses.append("author = ?")
-            params.append(filters.author)
+            params.append(author)
 
-        if filters.text_search:
+        if text_search:
             # Exact substring match for text content
-            where_clauses.append("text LIKE ?")
-            params.append(f"%{filters.text_search}%")
+            where_clauses.append("text LIKE ? ESCAPE '\\'")
+            params.append(f"%{_escape_like(text_search)}%")
+
+        # GLOB is case-sensitive like the default BINARY collation, so SQLite can turn a constant
+        # prefix into a range search on an index (unlike the case-insensitive LIKE above)
+        if title_prefix:
+            where_clauses.append("title GLOB ?")
+            params.append(f"{_escape_glob(title_prefix)}*")
 
-        # Validate sort parameters
-        valid_sort_fields = ["date_exported", "date_highlighted", "title", "author"]
-        sort_by = filters.sort_by
-        if sort_by not in valid_sort_fields:
+        if author_prefix:
+            where_clauses.append("author GLOB ?")
+            params.append(f"{_escape_glob(author_prefix)}*")
+
+        return (" AND ".join(where_clauses) or None), params
+
+    @staticmethod
+    def _normalize_sort(sort_by: str, sort_dir: str) -> tuple[str, str]:
+        """Validate the sort field and direction, falling back to newest exports first."""
+        if sort_by not in SORT_FIELDS:
             sort_by = "date_exported"
 
-        valid_sort_dirs = ["asc", "desc"]
-        sort_dir = filters.sort_dir
-        if sort_dir.lower() not in valid_sort_dirs:
+        sort_dir = sort_dir.lower()
+        if sort_dir not in SORT_DIRECTIONS:
             sort_dir = "desc"
 
-        order_by = f"{sort_by} {sort_dir}"
+        return sort_by, sort_dir
+
+    @classmethod
+    def _build_order_by(cls, sort_by: str, sort_dir: str) -> str:
+        """Build a validated ORDER BY expression, with the id as tiebreaker so pages are stable."""
+        sort_by, sort_dir = cls._normalize_sort(sort_by, sort_dir)
+        return f"{sort_by} {sort_dir}, id {sort_dir}"
+
+    @classmethod
+    def _build_page_where(cls, filters: HighlightFilters) -> tuple[str | None, list[Any]]:
+        """Build the WHERE clause for one page of highlights: the filters plus the ``after`` cursor.
+
+        The cursor is resolved with a seek on ``(sort field, id)``, which SQLite can answer from
+        the sort order instead of stepping over every preceding row as it does for an OFFSET.
+        NULL sort keys are treated as the lowest values, matching SQLite's ordering. A cursor
+        string is decoded here; callers that already decoded it pass the (sort key, id) pair.
+
+        Args:
+            filters: Filters for highlights
+
+        Returns:
+            Tuple of (WHERE clause without the keyword or None if unfiltered, parameters)
+
+        Raises:
+            ValueError: If the cursor is malformed or was created for a different sort order
+        """
+        where_clause, params = cls._build_highlight_where(
+            filters.title, filters.author, filters.text_search, filters.title_prefix, filters.author_prefix
+        )
+        if not filters.after:
+            return where_clause, params
+
+        sort_by, sort_dir = cls._normalize_sort(filters.sort_by, filters.sort_dir)
+        if isinstance(filters.after, str):
+            sort_key, last_id = decode_highlight_cursor(filters.after, sort_by, sort_dir)
+        else:
+            sort_key, last_id = filters.after
+        op = ">" if sort_dir == "asc" else "<"
+        if sort_key is None:
+            seek = f"({sort_by} IS NULL AND id {op} ?)"
+            seek_params = [last_id]
+        else:
+            seek = f"({sort_by} {op} ? OR ({sort_by} = ? AND id {op} ?))"
+            seek_params = [sort_key, sort_key, last_id]
+        # Past a NULL key ascending, every non-NULL key follows; descending, NULL keys come last
+        if sort_dir == "asc" and sort_key is None:
+            seek = f"({sort_by} IS NOT NULL OR {seek})"
+        elif sort_dir == "desc" and sort_key is not None:
+            seek = f"({sort_by} IS NULL OR {seek})"
+
+        where_clause = f"{where_clause} AND {seek}" if where_clause else seek
+        return where_clause, [*params, *seek_params]
+
+    def _get_highlights_with_filters(self, filters: HighlightFilters) -> list[dict[str, Any]]:
+        """Internal implementation of retrieving highlights with filters.
+
+        Args:
+            filters: Filters for highlights
+
+        Returns:
+            List of filtered highlight records
+        """
+        logger.debug(
+            "Retrieving highlights with filters: title=%s, author=%s, text_search=%s",
+            filters.title,
+            filters.author,
+            filters.text_search,
+        )
+
+        where_clause, params = self._build_page_where(filters)
+        order_by = self._build_order_by(filters.sort_by, filters.sort_dir)
 
         try:
-            if where_clauses:
-                where_clause = " AND ".join(where_clauses)
+            if where_clause:
                 logger.debug("SQL where clause: %s, params: %s", where_clause, params)
                 highlights = list(
                     self.db["highlights"].rows_where(
@@ -393,45 +694,29 @@ class HighlightsDAO:
             return []
 
     def get_highlight_count_with_filters(
-        self, title: str | None = None, author: str | None = None, text_search: str | None = None
+        self,
+        title: str | None = None,
+        author: str | None = None,
+        text_search: str | None = None,
+        title_prefix: str | None = None,
+        author_prefix: str | None = None,
     ) -> int:
         """Get the count of highlights matching the specified filters.
 
         Args:
-            title: Filter by book title (partial match)
-            author: Filter by author (partial match)
-            text_search: Search in highlight text (partial match)
+            title: Filter by book title (exact, or prefix when ending in ``*``)
+            author: Filter by author (exact match)
+            text_search: Search in highlight text (substring match)
+            title_prefix: Filter by book title prefix (case-sensitive)
+            author_prefix: Filter by author prefix (case-sensitive)
 
         Returns:
             Count of matching highlights
         """
-        # Build the WHERE clause and parameters
-        where_clauses = []
-        params = []
-
-        if title:
-            # Handle wildcard search with * at the end (commonly used pattern)
-            if title.endswith("*"):
-                where_clauses.append("title LIKE ?")
-                params.append(f"{title[:-1]}%")  # Replace * with SQL wildcard %
-            else:
-                # Exact match if no wildcard
-                where_clauses.append("title = ?")
-                params.append(title)
-
-        if author:
-            # Exact match for author
-            where_clauses.append("author = ?")
-            params.append(author)
-
-        if text_search:
-            # Exact substring match for text content
-            where_clauses.append("text LIKE ?")
-            params.append(f"%{text_search}%")
+        where_clause, params = self._build_highlight_where(title, author, text_search, title_prefix, author_prefix)
 
         try:
-            if where_clauses:
-                where_clause = " AND ".join(where_clauses)
+            if where_clause:
                 logger.debug("Count SQL where clause: %s, params: %s", where_clause, params)
                 count = self.db["highlights"].count_where(where_clause, params)
             else:
@@ -561,6 +846,7 @@ class HighlightsDAO:
         """Close the database connection."""
         if self.db:
             logger.info("Closing database connection to: %s", self.db_path)
+            self.db.close()
             self.db = None  # Allow garbage collection
 
 
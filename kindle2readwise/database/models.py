@@ -1,6 +1,7 @@
 """Data models for kindle2readwise using Pydantic."""
 
 from datetime import datetime
+from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -51,7 +52,10 @@ class HighlightFilters(BaseModel):
     title: str | None = None
     author: str | None = None
     text_search: str | None = None
+    title_prefix: str | None = None
+    author_prefix: str | None = None
     limit: int = 100
     offset: int = 0
+    after: str | tuple[Any, int] | None = None
     sort_by: str = "date_exported"
     sort_dir: str = "desc"
@@ -1,12 +1,10 @@
 import logging
-from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import Literal
-
-from rich.logging import RichHandler
+from typing import Literal, get_args
 
 # Define standard log levels
 LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+LOG_LEVELS: tuple[str, ...] = get_args(LogLevel)
 
 # Define logger for this module
 logger = logging.getLogger(__name__)
@@ -15,6 +13,9 @@ logger = logging.getLogger(__name__)
 DEFAULT_LOG_DIR = Path.cwd() / "logs"
 DEFAULT_LOG_FILE = DEFAULT_LOG_DIR / "kindle2readwise.log"
 
+# Number of records buffered before the log file is written; ERROR and above are written at once
+LOG_FILE_BUFFER_CAPACITY = 256
+
 
 def setup_logging(
     level: LogLevel = "INFO",
@@ -25,6 +26,8 @@ def setup_logging(
     """Configure logging for the application.
 
     Sets up logging to both console (with rich formatting) and a rotating file.
+    File records are buffered in memory and written in batches of
+    ``LOG_FILE_BUFFER_CAPACITY``; an ERROR record, or shutting down logging, writes them out.
 
     Args:
         level: The minimum logging level to capture.
@@ -32,6 +35,11 @@ def setup_logging(
         max_bytes: The maximum size of the log file before rotation.
         backup_count: The number of backup log files to keep.
     """
+    # Imported here so that merely importing this module (done on every CLI run) stays cheap
+    from logging.handlers import MemoryHandler, RotatingFileHandler
+
+    from rich.logging import RichHandler
+
     log_level = getattr(logging, level.upper(), logging.INFO)
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     date_format = "%Y-%m-%d %H:%M:%S"
@@ -40,23 +48,16 @@ def setup_logging(
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
 
-    # Basic configuration - sets the root logger level
-    # Handlers will filter based on their own levels if set lower
-    logging.basicConfig(
-        level=log_level,
-        format=log_format,
-        datefmt=date_format,
-        handlers=[logging.NullHandler()],  # Prevent default handler if root is configured
-    )
-
+    # Configure the root logger directly; a logging.basicConfig() call here would only take the
+    # logging lock to install a placeholder handler that the console handler below supersedes
     root_logger = logging.getLogger()
-    # Ensure root logger level is set correctly (basicConfig might be called elsewhere)
     root_logger.setLevel(log_level)
 
     # Remove existing handlers attached to the root logger to avoid duplication
     for handler in root_logger.handlers[:]:
         # Keep NullHandler to prevent default stderr handler if no other handlers added
         if not isinstance(handler, logging.NullHandler):
+            handler.flush()  # Don't drop records still buffered by a previous setup
             root_logger.removeHandler(handler)
 
     # --- Console Handler (Rich) ---
@@ -71,8 +72,6 @@ def setup_logging(
     )
     console_handler.setFormatter(logging.Formatter(log_format, datefmt=date_format))
 
-    # Create root logger instance and add handlers
-    root_logger = logging.getLogger()
     root_logger.addHandler(console_handler)
 
     # --- File Handler (Rotating) - Add only if log_file is specified ---
@@ -86,8 +85,12 @@ def setup_logging(
             )
             file_handler.setLevel(log_level)
             file_handler.setFormatter(logging.Formatter(log_format, datefmt=date_format))
-            root_logger.addHandler(file_handler)
-            logger.debug("Added RotatingFileHandler for file: %s", log_file)
+            buffered_handler = MemoryHandler(
+                capacity=LOG_FILE_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler
+            )
+            buffered_handler.setLevel(log_level)
+            root_logger.addHandler(buffered_handler)
+            logger.debug("Added buffered RotatingFileHandler for file: %s", log_file)
         except Exception:
             # Log error if file handler setup fails, but continue with console logging
             logging.getLogger(__name__).error("Failed to set up file logging to %s", log_file, exc_info=True)
@@ -1,5 +1,6 @@
 import logging
 import re
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from pathlib import Path
 
@@ -13,6 +14,7 @@ class KindleClippingsParser:
     """Parser for Kindle 'My Clippings.txt' files."""
 
     SEPARATOR = "=========="
+    READ_CHUNK_SIZE = 64 * 1024  # Characters read from the clippings file at a time
     MIN_LINES_PER_CLIPPING = 2  # Allow clippings with just title and metadata (empty content)
 
     # Preview length limits for log messages
@@ -62,46 +64,39 @@ class KindleClippingsParser:
         """
         logger.info("Starting to parse clippings file: %s", self.clippings_file)
 
-        content = self._read_clippings_file()
-        raw_clippings = self._split_content(content)
-        return self._process_clippings(raw_clippings)
+        return self._process_clippings(self._iter_raw_clippings())
 
-    def _read_clippings_file(self) -> str:
-        """Read content from the clippings file.
+    def _iter_raw_clippings(self) -> Iterator[str]:
+        """Read the clippings file in chunks and yield the raw sections between separators.
 
-        Returns:
-            String content of the file
+        Yields the same sections as splitting the whole file on ``SEPARATOR``, without holding
+        the file contents and every raw section in memory at once.
+
+        Yields:
+            Raw clipping strings
 
         Raises:
             OSError: If file can't be read
         """
+        section_count = 0
         try:
             with open(self.clippings_file, encoding="utf-8-sig") as f:
-                content = f.read()
-            logger.debug("Successfully read %d bytes from %s", len(content), self.clippings_file)
-            return content
+                pending = ""
+                while chunk := f.read(self.READ_CHUNK_SIZE):
+                    *sections, pending = (pending + chunk).split(self.SEPARATOR)
+                    section_count += len(sections)
+                    yield from sections
         except Exception as e:
             logger.error("Failed to read clippings file %s", self.clippings_file, exc_info=True)
             raise OSError(f"Could not read clippings file: {self.clippings_file}") from e
+        logger.debug("Split %s into %d raw sections.", self.clippings_file, section_count + 1)
+        yield pending
 
-    def _split_content(self, content: str) -> list[str]:
-        """Split content by separator.
-
-        Args:
-            content: Full content of clippings file
-
-        Returns:
-            List of raw clipping strings
-        """
-        raw_clippings = content.split(self.SEPARATOR)
-        logger.debug("Split content into %d raw sections.", len(raw_clippings))
-        return raw_clippings
-
-    def _process_clippings(self, raw_clippings: list[str]) -> list[KindleClipping]:
+    def _process_clippings(self, raw_clippings: Iterable[str]) -> list[KindleClipping]:
         """Process all raw clippings.
 
         Args:
-            raw_clippings: List of raw clipping strings
+            raw_clippings: Raw clipping strings, consumed one at a time
 
         Returns:
             List of parsed KindleClipping objects
@@ -360,7 +355,7 @@ class KindleClippingsParser:
             page = match.group(2)
             location = match.group(3) if match.group(3) else None
             date_str = match.group(4)
-            logger.debug(f"Matched primary regex. Type: {clipping_type}, Page: {page}, Location: {location}")
+            logger.debug("Matched primary regex. Type: %s, Page: %s, Location: %s", clipping_type, page, location)
             return clipping_type, page, location, date_str
 
         # 2. Try location-only format: "- Your Highlight on Location X-Y | Added on..."
@@ -369,7 +364,7 @@ class KindleClippingsParser:
             clipping_type = location_only_match.group(1).lower()
             location = location_only_match.group(2)
             date_str = location_only_match.group(3)
-            logger.debug(f"Matched location-only regex. Type: {clipping_type}, Location: {location}")
+            logger.debug("Matched location-only regex. Type: %s, Location: %s", clipping_type, location)
             return clipping_type, None, location, date_str
 
         # 3. Try alternate format: "- Your Highlight at location X-Y | Added on..."
@@ -378,7 +373,7 @@ class KindleClippingsParser:
             clipping_type = alt_match.group(1).lower()
             location = alt_match.group(2) if alt_match.group(2) else None
             date_str = alt_match.group(3)
-            logger.debug(f"Matched alternate regex. Type: {clipping_type}, Location: {location}")
+            logger.debug("Matched alternate regex. Type: %s, Location: %s", clipping_type, location)
             return clipping_type, None, location, date_str
 
         # 4. Try page-only format: "- Your Highlight on page X-Y | Added on..."
@@ -387,7 +382,7 @@ class KindleClippingsParser:
             clipping_type = page_match.group(1).lower()
             page = page_match.group(2) if page_match.group(2) else None
             date_str = page_match.group(3)
-            logger.debug(f"Matched page-only regex. Type: {clipping_type}, Page: {page}")
+            logger.debug("Matched page-only regex. Type: %s, Page: %s", clipping_type, page)
             return clipping_type, page, None, date_str
 
         # 5. Special case for formats like "- Your Highlight on page 92 | location 1406-1407 | Added on..."
@@ -397,7 +392,7 @@ class KindleClippingsParser:
             try:
                 return self._extract_metadata_directly(metadata_line)
             except Exception as e:
-                logger.warning(f"Error in direct extraction: {e}")
+                logger.warning("Error in direct extraction: %s", e)
                 return None
 
         return None
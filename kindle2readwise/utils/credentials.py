@@ -29,7 +29,7 @@ def encode_token(token: str) -> str:
     try:
         return base64.b64encode(token.encode()).decode()
     except Exception as e:
-        logger.error(f"Error encoding token: {e}")
+        logger.error("Error encoding token: %s", e)
         return ""
 
 
@@ -47,7 +47,7 @@ def decode_token(encoded_token: str) -> str:
     try:
         return base64.b64decode(encoded_token.encode()).decode()
     except Exception as e:
-        logger.error(f"Error decoding token: {e}")
+        logger.error("Error decoding token: %s", e)
         return ""
 
 
@@ -74,10 +74,10 @@ def save_token_to_file(token: str, file_path: Path) -> bool:
         if os.name == "posix":
             os.chmod(file_path, 0o600)  # Owner read/write only
 
-        logger.debug(f"Token saved to {file_path}")
+        logger.debug("Token saved to %s", file_path)
         return True
     except Exception as e:
-        logger.error(f"Error saving token to file: {e}")
+        logger.error("Error saving token to file: %s", e)
         return False
 
 
@@ -91,7 +91,7 @@ def load_token_from_file(file_path: Path) -> str:
         str: The decoded token or empty string if error or file not found
     """
     if not file_path.exists():
-        logger.debug(f"Token file not found: {file_path}")
+        logger.debug("Token file not found: %s", file_path)
         return ""
 
     try:
@@ -102,10 +102,10 @@ def load_token_from_file(file_path: Path) -> str:
             return ""
 
         decoded_token = decode_token(encoded_token)
-        logger.debug(f"Token loaded from {file_path}")
+        logger.debug("Token loaded from %s", file_path)
         return decoded_token
     except Exception as e:
-        logger.error(f"Error loading token from file: {e}")
+        logger.error("Error loading token from file: %s", e)
         return ""
 
 
@@ -109,15 +109,16 @@ def _detect_kindle_windows() -> list[tuple[str, Path]]:
         if not (bitmask & (1 << (ord(letter) - ord("A")))):
             continue
 
-        drive_path = Path(f"{letter}:")
+        drive = f"{letter}:"
 
-        # Skip if drive doesn't exist
-        if not drive_path.exists():
+        # Skip if drive doesn't exist (os.path.exists avoids a full stat on Windows)
+        if not os.path.exists(drive):
             continue
 
         # Check for Kindle clippings file
-        clippings_path = drive_path / CLIPPINGS_RELATIVE_PATH
-        if clippings_path.exists():
+        clippings_file = os.path.join(drive, CLIPPINGS_RELATIVE_PATH)
+        if os.path.exists(clippings_file):
+            clippings_path = Path(clippings_file)
             try:
                 # Try to get volume label
                 volume_info = subprocess.check_output(
@@ -144,43 +145,63 @@ def _detect_kindle_linux() -> list[tuple[str, Path]]:
     Returns:
         List of tuples containing (device_name, clippings_path)
     """
+    # Common Linux mount points (as strings; the same root listed twice is scanned once)
+    mount_points = dict.fromkeys(
+        [
+            "/media",
+            "/mnt",
+            os.path.expanduser("~/.local/media"),
+            f"/media/{os.getenv('USER')}",
+        ]
+    )
+
     devices = []
+    for mount_point in mount_points:
+        if os.path.isdir(mount_point):
+            devices.extend(_scan_linux_mount_point(mount_point))
+
+    return devices
 
-    # Common Linux mount points
-    mount_points = [
-        Path("/media"),
-        Path("/mnt"),
-        Path(os.path.expanduser("~/.local/media")),
-        Path(f"/media/{os.getenv('USER')}"),
-    ]
 
-    # Check each mount point
-    for mount_point in mount_points:
-        if not mount_point.exists() or not mount_point.is_dir():
-            continue
+def _scan_linux_mount_point(mount_point: str) -> list[tuple[str, Path]]:
+    """Find Kindle clippings files under one Linux mount point.
+
+    Uses ``os.scandir`` and string paths so directory entries are typed without an extra
+    stat each; a ``Path`` is only built for clippings files that are actually found.
+
+    Args:
+        mount_point: Directory whose subdirectories may be mounted devices
+
+    Returns:
+        List of tuples containing (device_name, clippings_path)
+    """
+    devices = []
 
-        # Check first level subdirectories
-        for device_dir in mount_point.iterdir():
+    # Check first level subdirectories
+    with os.scandir(mount_point) as device_dirs:
+        for device_dir in device_dirs:
             if not device_dir.is_dir():
                 continue
 
             # Check if name matches Kindle identifiers
-            device_name = device_dir.name
-            is_likely_kindle = any(kindle_id in device_name for kindle_id in KINDLE_IDENTIFIERS)
+            is_likely_kindle = any(kindle_id in device_dir.name for kindle_id in KINDLE_IDENTIFIERS)
 
             # Also check second level for systems like Ubuntu that create user subdirs
             subdirs_to_check = [device_dir]
             if not is_likely_kindle:
-                for subdir in device_dir.iterdir():
-                    if subdir.is_dir() and any(kindle_id in subdir.name for kindle_id in KINDLE_IDENTIFIERS):
-                        subdirs_to_check.append(subdir)
+                with os.scandir(device_dir.path) as subdirs:
+                    subdirs_to_check.extend(
+                        subdir
+                        for subdir in subdirs
+                        if subdir.is_dir() and any(kindle_id in subdir.name for kindle_id in KINDLE_IDENTIFIERS)
+                    )
 
             # Check each candidate path for clippings file
             for check_dir in subdirs_to_check:
-                clippings_path = check_dir / CLIPPINGS_RELATIVE_PATH
-                if clippings_path.exists():
+                clippings_path = os.path.join(check_dir.path, CLIPPINGS_RELATIVE_PATH)
+                if os.path.exists(clippings_path):
                     logger.info("Found Kindle device: %s with clippings at %s", check_dir.name, clippings_path)
-                    devices.append((check_dir.name, clippings_path))
+                    devices.append((check_dir.name, Path(clippings_path)))
 
     return devices
 
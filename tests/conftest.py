@@ -0,0 +1,31 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from kindle2readwise.cli.utils.common import get_default_clippings_path
+from kindle2readwise.config import (
+    _load_config_file,
+    get_config_dir,
+    get_credentials_dir,
+    get_data_dir,
+    get_readwise_token,
+)
+
+_PROCESS_CACHES = (
+    get_default_clippings_path,
+    get_readwise_token,
+    _load_config_file,
+    get_config_dir,
+    get_data_dir,
+    get_credentials_dir,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_process_caches():
+    """Reset per-process caches so that each test sees a fresh filesystem state."""
+    for cached in _PROCESS_CACHES:
+        cached.cache_clear()
+    yield
+    for cached in _PROCESS_CACHES:
+        cached.cache_clear()
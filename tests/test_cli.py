@@ -1,4 +1,12 @@
+import csv
+import io
+import json
 import logging
+import re
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -7,12 +15,19 @@ from kindle2readwise import __version__
 
 # Update import to use the new CLI structure
 from kindle2readwise.cli.main import main as cli_main
-from kindle2readwise.database import HighlightsDAO
+from kindle2readwise.cli.parsers import COMMAND_HANDLERS, COMMAND_HELP, _fast_parse, _sniff_command, create_parser
+from kindle2readwise.cli.utils.common import get_default_clippings_path
+from kindle2readwise.database import HighlightsDAO, encode_highlight_cursor
 from kindle2readwise.exceptions import ProcessingError, ValidationError
+from kindle2readwise.parser.models import KindleClipping
 
 # Environment variable for token
 READWISE_TOKEN_ENV_VAR = "READWISE_API_TOKEN"
 
+# Highlights stored and listed by the streaming output test
+STREAMED_HIGHLIGHT_COUNT = 3
+STREAMED_PAGE_LIMIT = 2
+
 # --- Test Fixtures ---
 
 
@@ -45,6 +60,31 @@ def mock_kindle2readwise():
         yield mock_app
 
 
+@pytest.fixture
+def seeded_db(tmp_path, monkeypatch):
+    """Fixture returning a function that stores ``count`` highlights in a fresh database used by the CLI."""
+
+    def seed(count: int) -> str:
+        db_path = str(tmp_path / "highlights.db")
+        dao = HighlightsDAO(db_path)
+        for i in range(count):
+            dao.save_highlight(
+                KindleClipping(
+                    title="Paged Book",
+                    author="Author",
+                    type="highlight",
+                    location=str(i),
+                    date=datetime(2024, 1, 1, 12, 0, i),
+                    content=f"Highlight {i}",
+                )
+            )
+        dao.close()
+        monkeypatch.setattr("kindle2readwise.cli.commands.highlights.get_config_value", lambda *_args: db_path)
+        return db_path
+
+    return seed
+
+
 @pytest.fixture
 def mock_setup_logging():
     """Fixture to mock the logging setup function."""
@@ -93,11 +133,47 @@ def run_cli(args: list[str], expect_exit_code: int | None = 0):
 # --- Test Cases ---
 
 
-def test_cli_version(capsys):
-    """Test the --version flag."""
-    run_cli(["--version"], expect_exit_code=0)
+@pytest.mark.parametrize("argv", [["--version"], ["-V"], ["--log-level", "DEBUG", "--version"]])
+def test_cli_version(argv, capsys):
+    """Test the --version flag, both on its own (fast path) and alongside other options."""
+    run_cli(argv, expect_exit_code=0)
     captured = capsys.readouterr()
-    assert f"kindle2readwise {__version__}" in captured.out
+    assert captured.out == f"kindle2readwise {__version__}\n"
+
+
+@pytest.mark.parametrize(
+    ("argv", "expect_logging"),
+    [
+        (["version"], False),
+        (["--log-level", "DEBUG", "version"], False),
+        (["--log-file", "run.log", "version"], True),
+    ],
+)
+def test_version_command_skips_logging_setup(argv, expect_logging, mock_setup_logging, capsys):
+    """The version subcommand only configures logging when a log file is requested."""
+    run_cli(argv, expect_exit_code=0)
+    assert "kindle2readwise v" in capsys.readouterr().out
+    assert mock_setup_logging.called is expect_logging
+
+
+@pytest.mark.parametrize(
+    ("error", "log_level", "expect_traceback"),
+    [
+        (FileNotFoundError("missing.txt"), "DEBUG", False),
+        (ProcessingError("Processing failed"), "DEBUG", False),
+        (RuntimeError("boom"), "WARNING", False),
+        (RuntimeError("boom"), "DEBUG", True),
+    ],
+)
+@pytest.mark.usefixtures("mock_setup_logging")
+def test_main_error_handling(error, log_level, expect_traceback, caplog):
+    """Handler errors exit with 1; a traceback is only logged for unexpected errors at DEBUG."""
+    with patch("kindle2readwise.cli.commands.version.handle_version", side_effect=error):
+        run_cli(["--log-level", log_level, "version"], expect_exit_code=1)
+
+    (record,) = [r for r in caplog.records if r.name == "kindle2readwise.cli.main"]
+    assert str(error) in record.getMessage()
+    assert bool(record.exc_info) is expect_traceback
 
 
 def test_cli_help(capsys):
@@ -108,6 +184,82 @@ def test_cli_help(capsys):
     assert "export" in captured.out  # Check if commands are listed
 
 
+@pytest.mark.parametrize(
+    ("argv", "expected"),
+    [
+        (["export", "--dry-run"], "export"),
+        (["--log-level", "DEBUG", "history"], "history"),
+        (["--log-l", "DEBUG", "config", "show"], "config"),
+        (["--log-file=run.log", "reset-db"], "reset-db"),
+        (["--log-file", "export", "version"], "version"),
+        (["--help"], None),
+        (["unknown"], None),
+        ([], None),
+    ],
+)
+def test_sniff_command(argv, expected):
+    """Test that the subcommand is located in argv without parsing it."""
+    assert _sniff_command(argv) == expected
+
+
+def test_create_parser_builds_only_requested_command():
+    """Test that subcommands other than the requested one are registered as stubs."""
+    parser = create_parser(["history"])
+
+    args = parser.parse_args(["history", "--limit", "5"])
+    assert args.limit == 5  # noqa: PLR2004
+
+    # The export stub accepts no arguments of its own
+    with pytest.raises(SystemExit):
+        parser.parse_args(["export", "--dry-run"])
+
+
+@pytest.mark.parametrize("command", ["export", "history"])
+def test_db_path_option_is_shared(command):
+    """Test that subcommands taking --db-path get it from the shared parent parser."""
+    args = create_parser([command]).parse_args([command, "--db-path", "custom.db"])
+    assert args.db_path == "custom.db"
+
+
+def test_create_parser_defers_handler_imports():
+    """Test that building a command's parser does not import its handler module."""
+    code = (
+        "import sys; from kindle2readwise.cli.parsers import create_parser; "
+        "create_parser(['export', '--dry-run']).parse_args(['export', '--dry-run']); "
+        "print('kindle2readwise.cli.commands.export' in sys.modules, 'kindle2readwise.core' in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.split() == ["False", "False"]
+
+
+def test_default_clippings_path_is_cached(tmp_path, monkeypatch):
+    """Test that the default clippings path is probed only once per process."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "My Clippings.txt").touch()
+
+    with patch("kindle2readwise.utils.device_detection.find_kindle_clippings", return_value=None) as mock_find:
+        first = get_default_clippings_path()
+        second = get_default_clippings_path()
+
+    assert first == second == tmp_path / "My Clippings.txt"
+    mock_find.assert_called_once()
+
+
+def test_export_db_path_is_normalized_without_resolving_symlinks(tmp_path):
+    """Test that the export database path is made absolute without following symlinks."""
+    from kindle2readwise.cli.commands.export import _get_export_db_path
+
+    real_dir = tmp_path / "real"
+    real_dir.mkdir()
+    link_dir = tmp_path / "link"
+    link_dir.symlink_to(real_dir)
+
+    db_path = _get_export_db_path(MagicMock(db_path=str(link_dir / "sub" / ".." / "k2r.db")))
+
+    assert db_path == link_dir / "k2r.db"
+
+
 @pytest.mark.usefixtures("set_token_env")
 def test_cli_export_basic(tmp_path, mock_kindle2readwise):
     """Test basic successful export command using env var for token."""
@@ -224,6 +376,20 @@ def test_cli_export_validation_fails(tmp_path, mock_kindle2readwise):
         mock_app.process.assert_not_called()
 
 
+@pytest.mark.usefixtures("set_token_env")
+def test_cli_export_missing_file(tmp_path, mock_kindle2readwise):
+    """Test that export stops before creating the app when the clippings file does not exist."""
+    missing_file = tmp_path / "missing.txt"
+
+    with patch("pathlib.Path.cwd", return_value=tmp_path), patch.object(Path, "exists", autospec=True) as exists:
+        exists.side_effect = lambda path: False
+        run_cli(["export", str(missing_file)], expect_exit_code=1)
+
+    mock_kindle2readwise.assert_not_called()
+    # The file is probed by the explicit-path check and the fallback, not again by the handler
+    assert [c.args[0] for c in exists.call_args_list].count(missing_file) == 2
+
+
 @pytest.mark.usefixtures("set_token_env")
 def test_cli_export_process_fails(tmp_path, mock_kindle2readwise):
     """Test export command when processing fails."""
@@ -323,16 +489,13 @@ def test_highlights_commands(args, expected_output, expect_exit, capsys):
                 {"title": "Book 2", "author": "Author 2", "highlight_count": 5},
             ]
         elif "list" in args:
-            # Mock get_highlight_count_with_filters
-            mock_dao.get_highlight_count_with_filters.return_value = 15
-
             # Different behaviors based on title filter
             if "--title" in args and args[args.index("--title") + 1] == "NonExistentBook":
-                mock_dao.get_highlights.return_value = []  # No highlights found
+                mock_dao.get_highlights_with_total.return_value = ([], 0)  # No highlights found
             else:
-                # Mock get_highlights for normal case - accept any kwargs
-                def mock_get_highlights(**kwargs):  # noqa: ARG001 - kwargs is intentionally unused
-                    return [
+                # Mock get_highlights_with_total for normal case - accept any kwargs
+                def mock_get_highlights_with_total(**kwargs):  # noqa: ARG001 - kwargs is intentionally unused
+                    highlights = [
                         {
                             "id": 1,
                             "title": "Test Book",
@@ -343,8 +506,9 @@ def test_highlights_commands(args, expected_output, expect_exit, capsys):
                             "date_exported": "2023-01-02T12:00:00",
                         }
                     ]
+                    return highlights, 15
 
-                mock_dao.get_highlights.side_effect = mock_get_highlights
+                mock_dao.get_highlights_with_total.side_effect = mock_get_highlights_with_total
         elif "delete" in args:
             # Mock delete_highlight that returns False (failed)
             mock_dao.delete_highlight.return_value = False
@@ -367,34 +531,38 @@ def test_highlights_list_with_filters(capsys):
     with patch("kindle2readwise.cli.commands.highlights.HighlightsDAO") as mock_dao_class:
         mock_dao = mock_dao_class.return_value
 
-        # Mock get_highlight_count_with_filters
-        mock_dao.get_highlight_count_with_filters.return_value = 3
-
-        # Mock get_highlights
-        mock_dao.get_highlights.return_value = [
-            {
-                "id": 1,
-                "title": "Test Book",
-                "author": "Test Author",
-                "text": "This is some content to test with.",
-                "location": "123-125",
-                "date_highlighted": "2023-01-01T12:00:00",
-                "date_exported": "2023-01-02T12:00:00",
-            }
-        ]
+        # Mock get_highlights_with_total: one page of results out of 3 matches
+        mock_dao.get_highlights_with_total.return_value = (
+            [
+                {
+                    "id": 1,
+                    "title": "Test Book",
+                    "author": "Test Author",
+                    "text": "This is some content to test with.",
+                    "location": "123-125",
+                    "date_highlighted": "2023-01-01T12:00:00",
+                    "date_exported": "2023-01-02T12:00:00",
+                }
+            ],
+            3,
+        )
 
         # Run the command
         run_cli(args, expect_exit_code=None)
 
-        # Check that get_highlights was called with the correct filter parameters
-        mock_dao.get_highlights.assert_called_with(
+        # Check that get_highlights_with_total was called with the correct filter parameters
+        mock_dao.get_highlights_with_total.assert_called_with(
             title="Test",
             author="Author",
             text_search="content",
-            limit=20,  # Default limit
+            title_prefix=None,
+            author_prefix=None,
+            limit=21,  # Default limit, plus one row to tell whether another page follows
             offset=0,  # Default offset
             sort_by="date_exported",  # Default sort field
             sort_dir="desc",  # Default sort direction
+            after=None,  # No page cursor
+            with_total=True,
         )
 
         # Verify output has expected strings
@@ -403,6 +571,158 @@ def test_highlights_list_with_filters(capsys):
         assert "Test Book" in captured.out
 
 
+@pytest.mark.parametrize("output_format", ["json", "csv", "ndjson"])
+def test_highlights_list_streams_structured_output(output_format, capsys, seeded_db):
+    """Test that JSON and CSV listings stream every matching row from a real database."""
+    seeded_db(STREAMED_HIGHLIGHT_COUNT)
+    format_args = ["--format", "json", "--stream"] if output_format == "ndjson" else ["--format", output_format]
+    run_cli(["highlights", "list", "--limit", str(STREAMED_PAGE_LIMIT), *format_args], expect_exit_code=None)
+
+    out = capsys.readouterr().out
+    if output_format == "ndjson":
+        rows = [json.loads(line) for line in out.splitlines()]
+        assert len(rows) == STREAMED_PAGE_LIMIT
+        assert rows[0]["title"] == "Paged Book"
+    elif output_format == "json":
+        result = json.loads(out)
+        assert result["count"] == STREAMED_HIGHLIGHT_COUNT
+        assert result["limit"] == STREAMED_PAGE_LIMIT
+        assert len(result["highlights"]) == STREAMED_PAGE_LIMIT
+        assert result["highlights"][0]["title"] == "Paged Book"
+        assert out == json.dumps(result, indent=2) + "\n"
+    else:
+        rows = list(csv.reader(io.StringIO(out)))
+        assert rows[0][:3] == ["ID", "Title", "Author"]
+        assert len(rows) == STREAMED_PAGE_LIMIT + 1  # header + one page of rows
+
+
+def test_highlights_without_subcommand_lists(capsys):
+    """Test that a bare 'highlights' command lists highlights with no filters."""
+    with patch("kindle2readwise.cli.commands.highlights.HighlightsDAO") as mock_dao_class:
+        mock_dao = mock_dao_class.return_value
+        page = [{"id": 1, "title": "Test Book", "author": "Test Author", "text": "Text"}]
+        mock_dao.get_highlights_with_total.return_value = (page, 1)
+
+        run_cli(["highlights"], expect_exit_code=None)
+
+    out = capsys.readouterr().out
+    assert "Unknown subcommand" not in out
+    assert "Test Book" in out
+    assert mock_dao.get_highlights_with_total.call_args.kwargs["title"] is None
+
+
+@pytest.mark.parametrize(("output_format", "expected"), [("text", "Showing 1 highlights"), ("json", '"count": null')])
+def test_highlights_list_without_total(output_format, expected, capsys):
+    """Test that --no-total skips the count and the output says so."""
+    with patch("kindle2readwise.cli.commands.highlights.HighlightsDAO") as mock_dao_class:
+        mock_dao = mock_dao_class.return_value
+        page = [{"id": 1, "title": "Test Book", "author": "Test Author", "text": "Text"}]
+        mock_dao.get_highlights_with_total.return_value = (page, None)
+        mock_dao.iter_highlights_with_total.return_value = (iter(page), None)
+
+        run_cli(["highlights", "list", "--no-total", "--format", output_format], expect_exit_code=None)
+
+    assert expected in capsys.readouterr().out
+    called = mock_dao.iter_highlights_with_total if output_format == "json" else mock_dao.get_highlights_with_total
+    assert called.call_args.kwargs["with_total"] is False
+
+
+@pytest.mark.usefixtures("mock_setup_logging")
+def test_highlights_list_pages_with_cursor(capsys, caplog, seeded_db):
+    """Test that the cursor printed after a full page resumes the listing where it stopped."""
+    seeded_db(STREAMED_HIGHLIGHT_COUNT)
+
+    seen = []
+    list_args = ["highlights", "list", "--limit", str(STREAMED_PAGE_LIMIT), "--sort", "date_highlighted"]
+    args = list_args
+    with patch.object(
+        HighlightsDAO, "get_highlights_with_total", autospec=True, side_effect=HighlightsDAO.get_highlights_with_total
+    ) as mock_get:
+        while True:
+            run_cli(args, expect_exit_code=None)
+            out = capsys.readouterr().out
+            seen.extend(line for line in out.splitlines() if line.startswith("Text: "))
+            cursor = [line.split()[-1] for line in out.splitlines() if line.startswith("Next page: --after ")]
+            if not cursor:
+                break
+            args = [*list_args, "--after", cursor[0]]
+
+        run_cli([*list_args, "--offset", "1"], expect_exit_code=None)
+
+    assert seen == [f"Text: Highlight {i}" for i in reversed(range(STREAMED_HIGHLIGHT_COUNT))]
+    assert "--offset is deprecated" in caplog.text
+
+    first_page, next_page, offset_page = (call.kwargs for call in mock_get.call_args_list)
+    assert first_page["after"] is None
+    assert next_page["after"] == ("2024-01-01T12:00:01", 2)  # Decoded (sort key, id) of the last row shown
+    assert next_page["sort_by"] == "date_highlighted"
+    assert offset_page["offset"] == 1
+    assert offset_page["after"] is None
+
+
+@pytest.mark.parametrize(("offset", "expect_hint"), [(0, True), (STREAMED_PAGE_LIMIT, False)])
+def test_highlights_list_text_hint_on_last_full_page(offset, expect_hint, capsys, seeded_db):
+    """Test that a full text page offers a next page only when more highlights follow it."""
+    seeded_db(2 * STREAMED_PAGE_LIMIT)
+
+    run_cli(["highlights", "list", "--limit", str(STREAMED_PAGE_LIMIT), "--offset", str(offset)], expect_exit_code=None)
+
+    out = capsys.readouterr().out
+    assert out.count("Text: Highlight") == STREAMED_PAGE_LIMIT
+    assert ("Next page: --after " in out) is expect_hint
+
+
+@pytest.mark.parametrize("output_format", ["text", "json", "csv"])
+def test_highlights_list_hint_only_when_more_follow(output_format, capsys, seeded_db):
+    """Test that no next-page cursor is printed for a page that returns exactly the remaining highlights."""
+    seeded_db(2 * STREAMED_PAGE_LIMIT)
+    list_args = ["highlights", "list", "--limit", str(STREAMED_PAGE_LIMIT), "--format", output_format]
+
+    def list_page(args):
+        run_cli(args, expect_exit_code=None)
+        captured = capsys.readouterr()
+        # Structured formats print the cursor to stderr to keep stdout machine-readable
+        lines = (captured.out + captured.err).splitlines()
+        hints = [line.split()[-1] for line in lines if line.startswith("Next page: --after ")]
+        return len(re.findall(r"Highlight \d", captured.out)), hints
+
+    rows, [cursor] = list_page(list_args)
+    assert rows == STREAMED_PAGE_LIMIT
+    assert list_page([*list_args, "--after", cursor]) == (STREAMED_PAGE_LIMIT, [])
+    whole_args = ["highlights", "list", "--limit", str(2 * STREAMED_PAGE_LIMIT), "--format", output_format]
+    assert list_page(whole_args) == (2 * STREAMED_PAGE_LIMIT, [])
+
+
+@pytest.mark.parametrize(
+    "cursor", ["not a cursor", encode_highlight_cursor({"id": 1, "title": "Book"}, "title", "asc")]
+)
+def test_highlights_list_invalid_cursor(cursor, capsys, caplog):
+    """Test that a malformed or mismatched --after cursor exits with a one-line error and no traceback."""
+    with patch("kindle2readwise.cli.commands.highlights.HighlightsDAO") as mock_dao_class:
+        run_cli(["highlights", "list", "--after", cursor], expect_exit_code=1)
+
+    captured = capsys.readouterr()
+    assert "Error: invalid --after cursor (" in captured.out
+    assert "Traceback" not in captured.out + captured.err + caplog.text
+    mock_dao_class.return_value.get_highlights_with_total.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("deleted", "expected_output"), [(4, "Successfully deleted 4 highlights."), (0, "No highlights found")]
+)
+def test_highlights_delete_book_force_skips_count(deleted, expected_output, capsys):
+    """Test that a forced book deletion does not run a separate count query."""
+    with patch("kindle2readwise.cli.commands.highlights.HighlightsDAO") as mock_dao_class:
+        mock_dao = mock_dao_class.return_value
+        mock_dao.delete_highlights_by_book.return_value = deleted
+
+        run_cli(["highlights", "delete", "--book", "Test Book", "--force"], expect_exit_code=None)
+
+        mock_dao.get_highlight_count_with_filters.assert_not_called()
+        mock_dao.delete_highlights_by_book.assert_called_once_with("Test Book", None)
+        assert expected_output in capsys.readouterr().out
+
+
 @pytest.mark.usefixtures("monkeypatch")
 def test_highlights_delete_book_confirm(capsys):
     """Test the highlights delete book command with confirmation."""
@@ -468,3 +788,45 @@ def test_highlights_delete_book_cancel(capsys):
         # Verify output has cancellation message
         captured = capsys.readouterr()
         assert "Deletion cancelled" in captured.out
+
+
+@pytest.mark.parametrize("argv", [["version"], ["config"], ["config", "show"], ["config", "paths"]])
+def test_fast_parse_matches_argparse(argv):
+    """Test that option-free invocations parse to the same namespace as the full parser."""
+    fast = _fast_parse(argv)
+    full = create_parser(argv).parse_args(argv)
+
+    assert fast is not None
+    assert vars(fast) == vars(full)
+
+
+def test_every_command_has_a_handler():
+    """Test that each registered subcommand can be dispatched."""
+    assert COMMAND_HANDLERS.keys() == COMMAND_HELP.keys()
+
+
+@pytest.mark.parametrize("argv", [["config", "show", "-h"], ["--log-level", "DEBUG", "version"], ["history"], []])
+def test_fast_parse_defers_to_argparse(argv):
+    """Test that anything with options or unlisted commands uses the full parser."""
+    assert _fast_parse(argv) is None
+
+
+@pytest.mark.parametrize(
+    "delete_args", [["highlights", "delete"], ["highlights", "delete", "--id", "1", "--book", "Test Book"]]
+)
+def test_highlights_delete_requires_exactly_one_target(delete_args, capsys):
+    """Test that highlights delete rejects a missing or ambiguous target before opening the database."""
+    with patch("kindle2readwise.cli.commands.highlights.HighlightsDAO") as mock_dao_class:
+        run_cli(delete_args, expect_exit_code=1)
+
+        mock_dao_class.assert_not_called()
+        assert "exactly one of --id or --book" in capsys.readouterr().out
+
+
+def test_parser_sort_choices_match_database():
+    """Test that the CLI offers exactly the sort options the database layer accepts."""
+    from kindle2readwise.cli import parsers
+    from kindle2readwise.database import db_manager
+
+    assert parsers.SORT_FIELDS == db_manager.SORT_FIELDS
+    assert parsers.SORT_DIRECTIONS == db_manager.SORT_DIRECTIONS
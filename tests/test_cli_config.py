@@ -50,6 +50,14 @@ def mock_config_file(mock_config_dir):
         yield config_file
 
 
+@pytest.fixture
+def tty_stdin():
+    """Make stdin look like an interactive terminal so the token prompt is used."""
+    with mock.patch("sys.stdin") as stdin:
+        stdin.isatty.return_value = True
+        yield stdin
+
+
 class CaptureStdout:
     """Context manager to capture stdout."""
 
@@ -90,6 +98,19 @@ class TestConfigCommands:
         assert "test_key: test_value" in output
         assert "Configuration directory" in output
         assert "Data directory" in output
+        assert "Missing Readwise API token" in output
+
+    @pytest.mark.usefixtures("mock_config_file")
+    def test_handle_config_show_configured(self):
+        """Test that a stored token is reported as a complete configuration."""
+        handle_config_token(mock.MagicMock(token="test-token-12345"))
+
+        with CaptureStdout() as captured:
+            handle_config_show(mock.MagicMock())
+            output = captured.get_output()
+
+        assert "Application is properly configured." in output
+        assert "Missing Readwise API token" not in output
 
     def test_handle_config_token_arg(self, mock_config_dir):
         """Test setting token via command line argument."""
@@ -110,11 +131,13 @@ class TestConfigCommands:
         token_file = mock_config_dir / "readwise_token"
         assert token_file.exists()
 
+    @pytest.mark.usefixtures("tty_stdin")
     def test_handle_config_token_interactive(self, mock_config_dir):
         """Test setting token interactively."""
         # Mock args without token
         args = mock.MagicMock()
         args.token = None
+        args.stdin = False
 
         # Mock getpass to return a token
         with mock.patch("getpass.getpass", return_value="interactive-token-12345"), CaptureStdout() as captured:
@@ -129,12 +152,13 @@ class TestConfigCommands:
         token_file = mock_config_dir / "readwise_token"
         assert token_file.exists()
 
-    @pytest.mark.usefixtures("mock_config_dir")
+    @pytest.mark.usefixtures("mock_config_dir", "tty_stdin")
     def test_handle_config_token_interactive_empty(self):
         """Test handling empty token input."""
         # Mock args without token
         args = mock.MagicMock()
         args.token = None
+        args.stdin = False
 
         # Mock getpass to return empty string
         with mock.patch("getpass.getpass", return_value=""), CaptureStdout() as captured:
@@ -145,12 +169,13 @@ class TestConfigCommands:
         assert "No token provided" in output
         assert "Operation cancelled" in output
 
-    @pytest.mark.usefixtures("mock_config_dir")
+    @pytest.mark.usefixtures("mock_config_dir", "tty_stdin")
     def test_handle_config_token_interactive_cancel(self):
         """Test cancelling token input."""
         # Mock args without token
         args = mock.MagicMock()
         args.token = None
+        args.stdin = False
 
         # Mock getpass to raise KeyboardInterrupt
         with mock.patch("getpass.getpass", side_effect=KeyboardInterrupt), CaptureStdout() as captured:
@@ -160,6 +185,58 @@ class TestConfigCommands:
         # Check output
         assert "Operation cancelled" in output
 
+    def test_handle_config_token_piped(self, mock_config_dir):
+        """Test reading the token from piped stdin with --stdin, without prompting."""
+        args = mock.MagicMock()
+        args.token = None
+        args.stdin = True
+
+        with (
+            mock.patch("sys.stdin", StringIO("piped-token-12345\n")),
+            mock.patch("getpass.getpass") as mock_getpass,
+            CaptureStdout() as captured,
+        ):
+            handle_config_token(args)
+            output = captured.get_output()
+
+        mock_getpass.assert_not_called()
+        assert "successfully saved" in output
+        assert (mock_config_dir / "readwise_token").exists()
+
+    @pytest.mark.usefixtures("mock_config_dir")
+    def test_handle_config_token_piped_empty(self):
+        """Test that --stdin with empty input fails instead of saving an empty token."""
+        args = mock.MagicMock()
+        args.token = None
+        args.stdin = True
+
+        with mock.patch("sys.stdin", StringIO("")), CaptureStdout() as captured, pytest.raises(SystemExit) as exc:
+            handle_config_token(args)
+
+        assert exc.value.code == 1
+        assert "No token provided on stdin" in captured.get_output()
+
+    @pytest.mark.usefixtures("mock_config_dir")
+    def test_handle_config_token_not_tty_fails_fast(self):
+        """Test that without --stdin a non-interactive stdin is never read or prompted on."""
+        args = mock.MagicMock()
+        args.token = None
+        args.stdin = False
+
+        with (
+            mock.patch("sys.stdin") as stdin,
+            mock.patch("getpass.getpass") as mock_getpass,
+            CaptureStdout() as captured,
+            pytest.raises(SystemExit) as exc,
+        ):
+            stdin.isatty.return_value = False
+            handle_config_token(args)
+
+        assert exc.value.code == 1
+        assert "stdin is not a TTY" in captured.get_output()
+        stdin.readline.assert_not_called()
+        mock_getpass.assert_not_called()
+
     def test_handle_config_set_valid(self, mock_config_file):
         """Test setting a valid configuration value."""
         # Mock args
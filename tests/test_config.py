@@ -79,6 +79,17 @@ class TestConfigPaths:
             assert isinstance(data_dir, Path)
             assert data_dir == fake_config_dir / "data"
 
+    def test_get_data_dir_resolved_once(self):
+        """Test that the data directory is resolved once and then served from the cache."""
+        with (
+            mock.patch("kindle2readwise.config.get_config_dir") as mock_config_dir,
+            tempfile.TemporaryDirectory() as temp_dir,
+        ):
+            mock_config_dir.return_value = Path(temp_dir)
+
+            assert get_data_dir() is get_data_dir()
+            mock_config_dir.assert_called_once_with()
+
 
 class TestConfigOperations:
     """Tests for configuration loading and saving functions."""
@@ -153,6 +164,22 @@ class TestConfigValues:
             config = load_config()
             assert config["new_key"] == "new_value"
 
+    def test_config_file_is_read_once_until_saved(self, mock_config_dir):
+        """Test that the config file is cached, returned as a copy, and re-read after saving."""
+        config_file = mock_config_dir / "test_cached.json"
+
+        with mock.patch("kindle2readwise.config.get_config_file_path", return_value=config_file):
+            save_config(DEFAULT_CONFIG.copy())
+            assert get_config_value("log_level") == "WARNING"
+
+            with mock.patch("kindle2readwise.config.json.load") as mock_json_load:
+                load_config()["log_level"] = "DEBUG"  # Mutating the copy must not leak into the cache
+                assert get_config_value("log_level") == "WARNING"
+                mock_json_load.assert_not_called()
+
+            set_config_value("log_level", "ERROR")
+            assert get_config_value("log_level") == "ERROR"
+
 
 class TestReadwiseToken:
     """Tests for Readwise API token management."""
@@ -170,6 +197,20 @@ class TestReadwiseToken:
             token = get_readwise_token()
             assert token == test_token
 
+    def test_get_readwise_token_is_cached_until_set(self, mock_config_dir):
+        """Test that the token file is read once and re-read after storing a new token."""
+        token_file = mock_config_dir / "readwise_token"
+        with mock.patch("kindle2readwise.config.get_token_file_path", return_value=token_file):
+            set_readwise_token("first-token")
+            assert get_readwise_token() == "first-token"
+
+            with mock.patch("kindle2readwise.config.load_token_from_file") as mock_load:
+                assert get_readwise_token() == "first-token"
+                mock_load.assert_not_called()
+
+            set_readwise_token("second-token")
+            assert get_readwise_token() == "second-token"
+
     def test_is_configured(self, mock_config_dir):
         """Test checking if the application is configured."""
         with mock.patch("kindle2readwise.config.get_token_file_path", return_value=mock_config_dir / "readwise_token"):
@@ -7,7 +7,7 @@ import pytest
 import sqlite_utils
 
 from kindle2readwise.database import HighlightsDAO
-from kindle2readwise.database.db_manager import generate_highlight_hash
+from kindle2readwise.database.db_manager import encode_highlight_cursor, generate_highlight_hash
 from kindle2readwise.parser.models import KindleClipping
 
 # Configure basic logging for tests
@@ -33,6 +33,7 @@ HIGHLIGHTS_AFTER_BOOK_DELETE_COUNT = 3
 HIGHLIGHTS_AFTER_BOOK_WITHOUT_AUTHOR_DELETE_COUNT = 4
 
 MIN_SAMPLE_HIGHLIGHT_COUNT = 3
+KEYSET_PAGE_SIZE = 2
 
 
 @pytest.fixture
@@ -425,6 +426,113 @@ def test_get_highlight_count_with_filters(dao: HighlightsDAO):
     assert dao.get_highlight_count_with_filters(title="Book Two", text_search="2-2") == 1
 
 
+@pytest.mark.usefixtures("populate_sample_highlights")
+def test_get_highlights_with_total(dao: HighlightsDAO):
+    """Test fetching a page of highlights together with the total match count."""
+    highlights, total = dao.get_highlights_with_total(
+        title="Book*", limit=BOOK_ONE_HIGHLIGHT_COUNT, sort_by="title", sort_dir="asc"
+    )
+
+    assert total == HIGHLIGHTS_WITH_BOOK_TITLE_COUNT
+    assert len(highlights) == BOOK_ONE_HIGHLIGHT_COUNT
+    assert all(h["title"] == "Book One" for h in highlights)
+    assert "_total_matches" not in highlights[0]
+
+    # An offset past the last match still reports the total
+    highlights, total = dao.get_highlights_with_total(author="Author A", offset=10)
+    assert highlights == []
+    assert total == HIGHLIGHTS_WITH_AUTHOR_A_COUNT
+
+    # No matches at all
+    assert dao.get_highlights_with_total(title="Missing Book") == ([], 0)
+
+    # Counting can be skipped
+    highlights, total = dao.get_highlights_with_total(author="Author A", with_total=False)
+    assert len(highlights) == HIGHLIGHTS_WITH_AUTHOR_A_COUNT
+    assert "_total_matches" not in highlights[0]
+    assert total is None
+
+
+@pytest.mark.usefixtures("populate_sample_highlights")
+def test_get_highlights_by_prefix(dao: HighlightsDAO):
+    """Test case-sensitive prefix filters, including literal GLOB metacharacters."""
+    assert dao.get_highlight_count_with_filters(title_prefix="Book") == HIGHLIGHTS_WITH_BOOK_TITLE_COUNT
+    assert dao.get_highlight_count_with_filters(title_prefix="book") == 0
+    two = dao.get_highlight_count_with_filters(title_prefix="Book", author_prefix="Author B")
+    assert two == BOOK_TWO_HIGHLIGHT_COUNT
+    assert dao.get_highlight_count_with_filters(title_prefix="Book*") == 0
+    assert dao.get_highlight_count_with_filters(title_prefix="Book [") == 0
+
+    highlights, total = dao.get_highlights_with_total(title_prefix="Book O")
+    assert total == BOOK_ONE_HIGHLIGHT_COUNT
+    assert {h["title"] for h in highlights} == {"Book One"}
+
+
+@pytest.mark.parametrize(
+    ("filters", "expected_texts"),
+    [
+        ({"text_search": "100%"}, ["Only 100% sure"]),
+        ({"text_search": "_"}, ["snake_case"]),
+        ({"text_search": "\\"}, ["C:\\path"]),
+        ({"title": "50%*"}, ["Only 100% sure"]),
+        ({"title": "_*"}, []),
+    ],
+)
+def test_like_filters_match_wildcards_literally(dao: HighlightsDAO, filters, expected_texts):
+    """Test that % _ and backslash in substring/prefix filters are not treated as wildcards."""
+    samples = [("50% Off", "Only 100% sure"), ("Plain", "snake_case"), ("Plain", "C:\\path"), ("Plain", "1000")]
+    for title, text in samples:
+        clipping = KindleClipping(
+            title=title, author="Author", type="highlight", location="1", date=datetime(2024, 1, 1), content=text
+        )
+        dao.save_highlight(clipping)
+
+    highlights = dao.get_highlights(**filters)
+
+    assert sorted(h["text"] for h in highlights) == expected_texts
+
+
+def test_title_prefix_uses_index(dao: HighlightsDAO):
+    """Test that a title prefix is answered with a range search on the title index."""
+    where_clause, params = dao._build_highlight_where(None, None, None, title_prefix="Book")
+    plan = dao.db.execute(f"EXPLAIN QUERY PLAN SELECT * FROM highlights WHERE {where_clause}", params).fetchall()
+
+    assert "USING INDEX" in plan[0][-1]
+
+
+@pytest.mark.parametrize("sort_by", ["title", "date_highlighted"])
+@pytest.mark.parametrize("sort_dir", ["asc", "desc"])
+def test_get_highlights_with_total_after_cursor(dao: HighlightsDAO, populate_sample_highlights, sort_by, sort_dir):
+    """Test that paging with cursors visits every highlight once, in listing order, including NULL sort keys."""
+    # Ties on the sort key (three highlights of Book Two) and NULL keys exercise the tiebreak
+    dao.db["highlights"].update(populate_sample_highlights[0], {"date_highlighted": None})
+    dao.db["highlights"].update(populate_sample_highlights[3], {"date_highlighted": None})
+    expected = [h["id"] for h in dao.get_highlights(sort_by=sort_by, sort_dir=sort_dir)]
+
+    seen = []
+    after = None
+    while True:
+        page, total = dao.get_highlights_with_total(
+            limit=KEYSET_PAGE_SIZE, sort_by=sort_by, sort_dir=sort_dir, after=after
+        )
+        assert total == TOTAL_HIGHLIGHTS_COUNT
+        if not page:
+            break
+        seen.extend(h["id"] for h in page)
+        after = encode_highlight_cursor(page[-1], sort_by, sort_dir)
+
+    assert seen == expected
+
+
+@pytest.mark.parametrize(
+    "cursor", ["not a cursor", encode_highlight_cursor({"id": 1, "title": "Book"}, "title", "asc")]
+)
+def test_get_highlights_rejects_invalid_cursor(dao: HighlightsDAO, cursor):
+    """Test that malformed cursors and cursors from another sort order are rejected."""
+    with pytest.raises(ValueError, match="cursor"):
+        dao.get_highlights_with_total(sort_by="title", sort_dir="desc", after=cursor)
+
+
 def test_delete_highlight(dao: HighlightsDAO, populate_sample_highlights):
     """Test deleting a highlight by ID."""
     highlight_ids = populate_sample_highlights
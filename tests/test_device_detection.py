@@ -8,6 +8,7 @@ import pytest
 
 from kindle2readwise.utils.device_detection import (
     _detect_kindle_macos,
+    _scan_linux_mount_point,
     detect_kindle_devices,
     find_kindle_clippings,
 )
@@ -164,3 +165,16 @@ def test_find_kindle_clippings_integration(monkeypatch, tmp_path):
     # Test the function
     result = find_kindle_clippings()
     assert result == clippings_file
+
+
+def test_scan_linux_mount_point(mock_volume_structure):
+    """Test that a Linux mount point is scanned at both the device and the user-subdirectory level."""
+    root = mock_volume_structure["root"]
+    nested_clippings = root / "user" / "KINDLE" / "documents" / "My Clippings.txt"
+    nested_clippings.parent.mkdir(parents=True)
+    nested_clippings.write_text("Nested clippings content")
+    (root / "not-a-dir.txt").write_text("")
+
+    devices = sorted(_scan_linux_mount_point(str(root)))
+
+    assert devices == [("KINDLE", nested_clippings), ("Kindle", mock_volume_structure["clippings_file"])]
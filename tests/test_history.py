@@ -1,5 +1,6 @@
 """Test the export history functionality."""
 
+import io
 import json
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
@@ -70,7 +71,43 @@ def test_display_history_table(mock_dao):
         assert "Total Exported: 40 highlights across 2 sessions" in table_output
 
 
-def test_export_history_formatted(mock_dao):
+def test_history_table_formats_dates():
+    """Test that ISO start times are shown as plain dates and bad values are kept as-is."""
+    from kindle2readwise.cli.utils.formatters import format_history_table
+
+    history = [
+        {"id": 1, "start_time": "2024-03-01T10:15:30.123456", "source_file": "a.txt"},
+        {"id": 2, "start_time": "2024-03-01T10:15:30.123456", "source_file": "a.txt"},
+        {"id": 3, "start_time": "not-a-date", "source_file": "a.txt"},
+        {"id": 4, "start_time": "", "source_file": "a.txt"},
+    ]
+
+    table_output = format_history_table(history)
+
+    assert table_output.count("2024-03-01 10:15:30 ") == 2
+    assert "not-a-date" in table_output
+    assert "Unknown" in table_output
+
+
+@pytest.mark.parametrize(
+    ("start_time", "end_time", "expected"),
+    [
+        ("2024-03-01T10:00:00", "2024-03-01T10:01:30", "Duration: 0:01:30"),
+        ("2024-03-01T10:00:00", None, "Duration: Unknown"),
+        ("2024-03-01T10:00:00", "not-a-date", "Duration: Unknown"),
+        ("2024-03-01T10:00:00+00:00", "2024-03-01T10:01:30", "Duration: Unknown"),
+    ],
+)
+def test_session_details_duration(start_time, end_time, expected):
+    """Test that the session duration is computed only from two comparable timestamps."""
+    from kindle2readwise.cli.utils.formatters import format_session_details
+
+    details = format_session_details({"id": 1, "start_time": start_time, "end_time": end_time})
+
+    assert expected in details
+
+
+def test_export_history_formatted(mock_dao, capsys):
     """Test formatting history as JSON and CSV."""
     from kindle2readwise.cli.commands.history import _export_history_formatted
 
@@ -90,19 +127,15 @@ def test_export_history_formatted(mock_dao):
         assert parsed_json[0]["id"] == FIRST_SESSION_ID
         assert parsed_json[1]["id"] == SECOND_SESSION_ID
 
-    # Test CSV format
-    with patch("builtins.print") as mock_print:
-        _export_history_formatted(mock_history, "csv")
-
-        # Verify CSV header was printed
-        args, _ = mock_print.call_args
-        csv_str = args[0]
+    # Test CSV format (written straight to stdout)
+    _export_history_formatted(mock_history, "csv")
+    csv_str = capsys.readouterr().out
 
-        # Check for CSV header and data
-        lines = csv_str.strip().split("\n")
-        assert len(lines) >= MIN_CSV_LINES  # Header + at least 2 data rows
-        assert "ID" in lines[0]
-        assert "Start Time" in lines[0]
+    # Check for CSV header and data
+    lines = csv_str.strip().splitlines()
+    assert len(lines) >= MIN_CSV_LINES  # Header + at least 2 data rows
+    assert "ID" in lines[0]
+    assert "Start Time" in lines[0]
 
 
 @pytest.fixture
@@ -166,3 +199,96 @@ def test_complete_export_session(temp_db_path):
     assert session.get("highlights_total", 0) >= 0
     assert session.get("highlights_new", 0) >= 0
     assert session.get("highlights_dupe", 0) >= 0
+
+
+def test_show_session_details_text(capsys):
+    """Test the text view of a single session, including the truncated highlight preview."""
+    from kindle2readwise.cli.commands.history import _show_session_details
+
+    dao = MagicMock(spec=HighlightsDAO)
+    dao.get_session_by_id.return_value = {"id": 7, "status": "completed", "highlights_total": 12}
+    dao.get_highlights_by_session.return_value = [
+        {"title": f"Book {i}", "author": "Author", "status": "sent"} for i in range(12)
+    ]
+
+    _show_session_details(dao, 7)
+    out = capsys.readouterr().out
+
+    assert "Session ID: 7" in out
+    assert "Highlights in this session: 12" in out
+    assert "Book 9 " in out
+    assert "Book 10" not in out
+    assert "... and 2 more highlights" in out
+
+
+@pytest.mark.parametrize(
+    ("text", "max_length", "expected"),
+    [
+        ("short", 10, "short"),
+        ("exactly10!", 10, "exactly10!"),
+        ("this is far too long", 10, "this is..."),
+    ],
+)
+def test_truncate_text(text, max_length, expected):
+    """Test that truncation keeps the column width and marks cut text with an ellipsis."""
+    from kindle2readwise.cli.utils.formatters import truncate_text
+
+    assert truncate_text(text, max_length) == expected
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_json_backends_match_stdlib(use_orjson):
+    """Test that JSON output has the stdlib layout whether or not orjson is available."""
+    from kindle2readwise.cli.utils import formatters
+
+    if use_orjson:
+        pytest.importorskip("orjson")
+    data = [{"id": 1, "title": "Café", "start_time": "2024-01-01T10:00:00", "end_time": None, "tags": []}]
+
+    with patch.object(formatters, "orjson", formatters.orjson if use_orjson else None):
+        assert formatters.dumps_json(data) == json.dumps(data, indent=2, ensure_ascii=False)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_write_highlights_ndjson(use_orjson):
+    """Test that NDJSON output is one compact object per line with either backend."""
+    from kindle2readwise.cli.utils import formatters
+
+    if use_orjson:
+        pytest.importorskip("orjson")
+    highlights = [{"id": 1, "title": "Book", "location": None}, {"id": 2, "title": "Café", "location": "12"}]
+    stream = io.StringIO()
+
+    with patch.object(formatters, "orjson", formatters.orjson if use_orjson else None):
+        formatters.write_highlights_ndjson(iter(highlights), stream)
+
+    assert stream.getvalue() == "".join(
+        json.dumps(h, ensure_ascii=False, separators=(",", ":")) + "\n" for h in highlights
+    )
+
+
+def test_handle_history_closes_dao(capsys):
+    """Test that the history command closes its database connection once done."""
+    from argparse import Namespace
+
+    from kindle2readwise.cli.commands.history import handle_history
+
+    with patch("kindle2readwise.cli.commands.history.HighlightsDAO") as dao_cls:
+        dao_cls.return_value.get_export_history.return_value = []
+        handle_history(Namespace(db_path="history.db", session=None, format=None, limit=5, details=False))
+
+    dao_cls.return_value.close.assert_called_once_with()
+    assert "No export history found." in capsys.readouterr().out
+
+
+def test_handle_history_zero_limit_skips_database(capsys):
+    """Test that a zero limit answers without opening the database."""
+    from argparse import Namespace
+
+    from kindle2readwise.cli.commands.history import handle_history
+
+    with patch("kindle2readwise.cli.commands.history.HighlightsDAO") as dao_cls:
+        handle_history(Namespace(db_path="history.db", session=None, format="json", limit=0, details=False))
+
+    dao_cls.assert_not_called()
+    assert "No export history found." in capsys.readouterr().out
@@ -195,3 +195,34 @@ def test_interactive_mode_no_highlights(interactive_args, mock_kindle2readwise,
     # Check the console output
     captured = capsys.readouterr()
     assert "No new highlights found to export" in captured.out
+
+
+def test_interactive_mode_ignores_unknown_ids(interactive_args, mock_kindle2readwise, mock_input, capsys):
+    """Test that IDs not among the pending highlights are reported and dropped from the selection."""
+    mock_input.side_effect = ["2, 7, 1", "y"]
+
+    with patch("pathlib.Path.exists") as mock_exists, patch("pathlib.Path.is_file") as mock_is_file:
+        mock_exists.return_value = True
+        mock_is_file.return_value = True
+        handle_export(interactive_args)
+
+    _, kwargs = mock_kindle2readwise.return_value.process_selected.call_args
+    assert kwargs["selected_ids"] == [SECOND_HIGHLIGHT_ID, FIRST_HIGHLIGHT_ID]
+
+    captured = capsys.readouterr()
+    assert "Warning: Invalid IDs ignored: 7" in captured.out
+    assert "Selected 2 highlights." in captured.out
+
+
+def test_interactive_mode_ignores_unrecognized_entries(interactive_args, mock_kindle2readwise, mock_input, capsys):
+    """Test that entries which aren't IDs are reported and skipped instead of cancelling the export."""
+    mock_input.side_effect = ["1 x, 2,", "y"]
+
+    with patch("pathlib.Path.exists") as mock_exists, patch("pathlib.Path.is_file") as mock_is_file:
+        mock_exists.return_value = True
+        mock_is_file.return_value = True
+        handle_export(interactive_args)
+
+    _, kwargs = mock_kindle2readwise.return_value.process_selected.call_args
+    assert kwargs["selected_ids"] == [FIRST_HIGHLIGHT_ID, SECOND_HIGHLIGHT_ID]
+    assert "Warning: Unrecognized entries ignored: x" in capsys.readouterr().out
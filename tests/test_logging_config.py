@@ -1,10 +1,11 @@
 import logging
+from logging.handlers import MemoryHandler
 from pathlib import Path
 
 import pytest
 from rich.logging import RichHandler
 
-from kindle2readwise.logging_config import DEFAULT_LOG_FILE, setup_logging
+from kindle2readwise.logging_config import DEFAULT_LOG_FILE, LOG_FILE_BUFFER_CAPACITY, setup_logging
 
 # Constants
 MIN_EXPECTED_HANDLERS = 2
@@ -36,6 +37,12 @@ def isolate_logging():
             pass  # Ignore if dir not empty or other issues
 
 
+def _file_handlers(root_logger):
+    """Return the file handlers behind the root logger's buffering handlers."""
+    buffered = [h for h in root_logger.handlers if isinstance(h, MemoryHandler)]
+    return [h.target for h in buffered if isinstance(h.target, logging.FileHandler)]
+
+
 def test_setup_logging_default(tmp_path):
     """Test setup_logging with default settings."""
     log_dir = tmp_path / "logs"
@@ -50,7 +57,7 @@ def test_setup_logging_default(tmp_path):
     assert len(root_logger.handlers) >= MIN_EXPECTED_HANDLERS  # Allow for potential NullHandler
 
     rich_handlers = [h for h in root_logger.handlers if isinstance(h, RichHandler)]
-    file_handlers = [h for h in root_logger.handlers if isinstance(h, logging.FileHandler)]
+    file_handlers = _file_handlers(root_logger)
 
     assert len(rich_handlers) == 1
     assert rich_handlers[0].level == logging.INFO
@@ -72,7 +79,7 @@ def test_setup_logging_debug_level(tmp_path):
     assert root_logger.level == logging.DEBUG
 
     rich_handlers = [h for h in root_logger.handlers if isinstance(h, RichHandler)]
-    file_handlers = [h for h in root_logger.handlers if isinstance(h, logging.FileHandler)]
+    file_handlers = _file_handlers(root_logger)
 
     assert rich_handlers[0].level == logging.DEBUG
     assert file_handlers[0].level == logging.DEBUG
@@ -112,3 +119,32 @@ def test_logging_output_to_file(tmp_path):
         assert test_message in content
         assert "INFO" in content
         assert "test_output" in content
+
+
+def test_file_logging_is_buffered_until_error(tmp_path):
+    """Test that file records are held in memory and written out when an ERROR is logged."""
+    log_file = tmp_path / "logs" / "buffered.log"
+
+    setup_logging(level="INFO", log_file=log_file)
+    logger = logging.getLogger("test_buffered")
+
+    logger.info("Buffered message")
+    assert "Buffered message" not in log_file.read_text()
+
+    logger.error("Error message")
+    content = log_file.read_text()
+    assert "Buffered message" in content
+    assert "Error message" in content
+
+
+def test_file_logging_flushes_full_buffer(tmp_path):
+    """Test that a full buffer is written to the file without waiting for an error."""
+    log_file = tmp_path / "logs" / "capacity.log"
+
+    setup_logging(level="INFO", log_file=log_file)
+    logger = logging.getLogger("test_capacity")
+
+    for i in range(LOG_FILE_BUFFER_CAPACITY):
+        logger.info("Message %d", i)
+
+    assert f"Message {LOG_FILE_BUFFER_CAPACITY - 1}" in log_file.read_text()
@@ -276,3 +276,14 @@ def test_image_highlights_are_merged(image_highlights_clippings_path):
     # Empty highlights should be consolidated (fewer than original due to merging)
     empty_highlights = [c for c in clippings if c.content.strip() == ""]
     assert len(empty_highlights) <= 2  # Should have at most 2 empty highlights after merging
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 10, 4096])
+def test_raw_sections_independent_of_chunk_size(sample_clippings_path, chunk_size, monkeypatch):
+    """Test that reading in chunks yields the same sections as splitting the whole file."""
+    parser = KindleClippingsParser(sample_clippings_path)
+    expected = sample_clippings_path.read_text(encoding="utf-8-sig").split(KindleClippingsParser.SEPARATOR)
+
+    monkeypatch.setattr(KindleClippingsParser, "READ_CHUNK_SIZE", chunk_size)
+
+    assert list(parser._iter_raw_clippings()) == expected